@@ -0,0 +1,19 @@
+import logging
+
+from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LogOpsAppConfig(AppConfig):
+    name = 'app'
+
+    def ready(self):
+        """Log the runtime environment once the app registry is loaded."""
+        from log_manager.settings import is_cloud_es
+
+        logger.info("🔧 Environment: %s", settings.DJANGO_ENV)
+        logger.info("🔍 Elasticsearch: %s (%s)",
+                    'Cloud' if is_cloud_es() else 'Local', settings.ELASTICSEARCH_CONFIG['HOST'])
+        logger.info("🤖 Together.ai: %s", 'Enabled' if settings.TOGETHER_API_KEY else 'Disabled')
@@ -1,12 +1,73 @@
 # app/management/commands/setup_elasticsearch.py
 import os
-import json
 import logging
+from datetime import datetime, timedelta
+import numpy as np
 from django.core.management.base import BaseCommand
+from elasticsearch import helpers
 from services.elasticsearch_service import elasticsearch_service
 
 logger = logging.getLogger(__name__)
 
+# Static sample-data vocabulary, built once at import time
+SAMPLE_APPLICATIONS = ('FOBPM', 'BOBPM', 'BRMS')
+SAMPLE_CLUSTERS = ('cluster1', 'cluster2', 'cluster3', 'cluster4')
+SAMPLE_BUNDLES = ('Bulkdeviceenrollment', 'Bulkordervalidation', 'IOTSubscription')
+SAMPLE_LOG_LEVELS = ('INFO', 'WARN', 'ERROR', 'DEBUG')
+SAMPLE_POD_ROLES = ('web', 'api', 'worker')
+
+SAMPLE_MESSAGES = {
+    'INFO': (
+        'Service started successfully',
+        'Processing request completed',
+        'Health check passed',
+        'Database connection established',
+        'User authentication successful'
+    ),
+    'WARN': (
+        'High memory usage detected: 85%',
+        'Response time degradation: 2.8s',
+        'Queue backlog growing: 150 pending items',
+        'Connection pool exhausted',
+        'Cache miss ratio high: 65%'
+    ),
+    'ERROR': (
+        'Database connection timeout after 30s',
+        'Failed to process request: connection refused',
+        'Authentication failed: invalid credentials',
+        'OutOfMemoryError: Java heap space',
+        'Network timeout: connection reset by peer'
+    ),
+    'DEBUG': (
+        'Method execution started',
+        'Variable state: processing=true',
+        'Cache lookup performed',
+        'Request parameters validated',
+        'Session data retrieved'
+    )
+}
+
+# Weight log levels realistically: 10% errors, 18% warnings, 72% info/debug.
+# 30% of logs carry a response time and 20% a status code.
+SAMPLE_LEVEL_WEIGHTS = (0.36, 0.18, 0.10, 0.36)
+SAMPLE_RESPONSE_TIME_RATE = 0.3
+SAMPLE_STATUS_CODE_RATE = 0.2
+SAMPLE_MESSAGES_PER_LEVEL = 5
+
+# Joint CDF over (level, message, has_response_time, has_status_code) so a
+# single searchsorted call draws all four fields for a whole batch
+SAMPLE_OUTCOME_CDF = np.cumsum(np.multiply.outer(
+    np.multiply.outer(
+        np.multiply.outer(
+            np.array(SAMPLE_LEVEL_WEIGHTS),
+            np.full(SAMPLE_MESSAGES_PER_LEVEL, 1 / SAMPLE_MESSAGES_PER_LEVEL)
+        ),
+        [1 - SAMPLE_RESPONSE_TIME_RATE, SAMPLE_RESPONSE_TIME_RATE]
+    ),
+    [1 - SAMPLE_STATUS_CODE_RATE, SAMPLE_STATUS_CODE_RATE]
+).ravel())
+SAMPLE_OUTCOME_CDF[-1] = 1.0
+
 class Command(BaseCommand):
     help = 'Setup Elasticsearch indices and mappings for LogOps'
 
@@ -33,14 +94,18 @@ class Command(BaseCommand):
                 )
                 return
             
-            # Test connection
-            if not elasticsearch_service.client.ping():
+            # A single cluster-health call both tests the connection and reports status
+            try:
+                health = elasticsearch_service.client.cluster.health()
+            except Exception as e:
                 self.stdout.write(
-                    self.style.ERROR('Cannot connect to Elasticsearch. Please check your configuration.')
+                    self.style.ERROR(f'Cannot connect to Elasticsearch. Please check your configuration. ({str(e)})')
                 )
                 return
             
-            self.stdout.write(self.style.SUCCESS('✓ Connected to Elasticsearch'))
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Connected to Elasticsearch (cluster status: {health["status"]})')
+            )
             
             # Recreate indices if requested
             if options['recreate']:
@@ -73,109 +138,118 @@ class Command(BaseCommand):
         
         indices = ['logops-logs', 'logops-metrics', 'logops-alerts']
         
-        for index in indices:
-            try:
-                if elasticsearch_service.client.indices.exists(index=index):
-                    elasticsearch_service.client.indices.delete(index=index)
+        try:
+            # One lookup to learn which indices exist, one call to drop them all
+            existing = elasticsearch_service.client.indices.get(
+                index=','.join(indices),
+                ignore_unavailable=True,
+                allow_no_indices=True
+            )
+            if existing:
+                elasticsearch_service.client.indices.delete(
+                    index=','.join(existing),
+                    ignore_unavailable=True,
+                    allow_no_indices=True
+                )
+            
+            for index in indices:
+                if index in existing:
                     self.stdout.write(f'  ✓ Deleted index: {index}')
                 else:
                     self.stdout.write(f'  - Index does not exist: {index}')
-            except Exception as e:
-                self.stdout.write(
-                    self.style.WARNING(f'  ! Could not delete index {index}: {str(e)}')
-                )
+        except Exception as e:
+            self.stdout.write(
+                self.style.WARNING(f'  ! Could not delete indices {", ".join(indices)}: {str(e)}')
+            )
     
     def load_sample_data(self):
         """Load sample log data into Elasticsearch"""
         self.stdout.write('Loading sample log data...')
         
-        from datetime import datetime, timedelta
-        import random
-        
-        sample_logs = []
+        count = 1000  # Generate 1000 sample logs
+        rng = np.random.default_rng()
         base_time = datetime.now() - timedelta(hours=24)
         
-        applications = ['FOBPM', 'BOBPM', 'BRMS']
-        clusters = ['cluster1', 'cluster2', 'cluster3', 'cluster4']
-        bundles = ['Bulkdeviceenrollment', 'Bulkordervalidation', 'IOTSubscription']
-        log_levels = ['INFO', 'WARN', 'ERROR', 'DEBUG']
+        # Draw every field for the whole batch in one shot
+        apps = rng.choice(SAMPLE_APPLICATIONS, size=count).tolist()
+        clusters_arr = rng.choice(SAMPLE_CLUSTERS, size=count).tolist()
+        bundles_arr = rng.choice(SAMPLE_BUNDLES, size=count).tolist()
+        
+        # Decode (level, message, has_rt, has_sc) from one draw on the joint CDF
+        outcomes = np.searchsorted(SAMPLE_OUTCOME_CDF, rng.random(count), side='right')
+        level_idx, remainder = np.divmod(outcomes, SAMPLE_MESSAGES_PER_LEVEL * 4)
+        message_idx, flags = np.divmod(remainder, 4)
+        levels = [SAMPLE_LOG_LEVELS[i] for i in level_idx.tolist()]
+        message_idx = message_idx.tolist()
+        has_rt = (flags >= 2).tolist()
+        has_sc = (flags % 2 == 1).tolist()
+        
+        # One vectorized add gives every timestamp in the last 24 hours
+        offsets = rng.integers(0, 24 * 3600, size=count)
+        timestamps = (np.datetime64(base_time) + offsets.astype('timedelta64[s]')).tolist()
+        
+        resp_times = np.round(rng.uniform(0.1, 5.0, size=count), 2).tolist()
+        status_codes = rng.choice([200, 201, 400, 401, 404, 500, 503], size=count).tolist()
+        
+        roles = rng.choice(SAMPLE_POD_ROLES, size=count).tolist()
+        pod_nums = rng.integers(1, 4, size=count).tolist()
+        
+        def gen_actions():
+            """Yield bulk actions lazily so indexing overlaps generation"""
+            for i in range(count):
+                app = apps[i]
+                bundle = bundles_arr[i]
+                message = SAMPLE_MESSAGES[levels[i]][message_idx[i]]
+                
+                if has_rt[i]:
+                    message += f" [response_time: {resp_times[i]}s]"
+                
+                if has_sc[i]:
+                    message += f" [status: {status_codes[i]}]"
+                
+                log_entry = {
+                    'timestamp': timestamps[i],
+                    'application': app,
+                    'cluster': clusters_arr[i],
+                    'bundle': bundle,
+                    'pod': f"{app.lower()}-{bundle.lower()}-{roles[i]}-{pod_nums[i]:03d}",
+                    'message': message,
+                    'source_file': 'sample_data'
+                }
+                
+                yield {'_index': index_name, '_source': log_entry}
         
-        for i in range(1000):  # Generate 1000 sample logs
-            app = random.choice(applications)
-            cluster = random.choice(clusters)
-            bundle = random.choice(bundles)
-            level = random.choice(log_levels)
-            
-            # Weight log levels realistically
-            if random.random() < 0.1:  # 10% errors
-                level = 'ERROR'
-            elif random.random() < 0.2:  # 20% warnings
-                level = 'WARN'
-            else:  # 70% info/debug
-                level = random.choice(['INFO', 'DEBUG'])
-            
-            log_time = base_time + timedelta(
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59),
-                seconds=random.randint(0, 59)
-            )
-            
-            messages = {
-                'INFO': [
-                    'Service started successfully',
-                    'Processing request completed',
-                    'Health check passed',
-                    'Database connection established',
-                    'User authentication successful'
-                ],
-                'WARN': [
-                    'High memory usage detected: 85%',
-                    'Response time degradation: 2.8s',
-                    'Queue backlog growing: 150 pending items',
-                    'Connection pool exhausted',
-                    'Cache miss ratio high: 65%'
-                ],
-                'ERROR': [
-                    'Database connection timeout after 30s',
-                    'Failed to process request: connection refused',
-                    'Authentication failed: invalid credentials',
-                    'OutOfMemoryError: Java heap space',
-                    'Network timeout: connection reset by peer'
-                ],
-                'DEBUG': [
-                    'Method execution started',
-                    'Variable state: processing=true',
-                    'Cache lookup performed',
-                    'Request parameters validated',
-                    'Session data retrieved'
-                ]
-            }
-            
-            message = random.choice(messages[level])
-            
-            # Add performance metrics for some logs
-            if random.random() < 0.3:  # 30% of logs have performance metrics
-                response_time = round(random.uniform(0.1, 5.0), 2)
-                message += f" [response_time: {response_time}s]"
-            
-            if random.random() < 0.2:  # 20% of logs have status codes
-                status_code = random.choice([200, 201, 400, 401, 404, 500, 503])
-                message += f" [status: {status_code}]"
-            
-            log_entry = {
-                'timestamp': log_time,
-                'application': app,
-                'cluster': cluster,
-                'bundle': bundle,
-                'pod': f"{app.lower()}-{bundle.lower()}-{random.choice(['web', 'api', 'worker'])}-{random.randint(1,3):03d}",
-                'message': message,
-                'source_file': 'sample_data'
-            }
-            
-            sample_logs.append(log_entry)
+        client = elasticsearch_service.client
+        index_name = 'logops-logs'
         
-        # Bulk index the sample logs
-        result = elasticsearch_service.bulk_index_logs(sample_logs)
+        # Pause refreshes and replication for the duration of the load
+        previous = client.indices.get_settings(index=index_name, flat_settings=True)
+        replicas = next(iter(previous.values()))['settings'].get('index.number_of_replicas', '1')
+        client.indices.put_settings(
+            index=index_name,
+            body={'index': {'refresh_interval': '-1', 'number_of_replicas': 0}}
+        )
+        
+        try:
+            # Stream the sample logs through parallel bulk workers
+            result = {'indexed': 0, 'errors': 0}
+            for ok, _ in helpers.parallel_bulk(
+                client,
+                gen_actions(),
+                thread_count=min(4, os.cpu_count() or 1),
+                chunk_size=1000,
+                max_chunk_bytes=10 * 1024 * 1024,
+                queue_size=4,
+                raise_on_error=False,
+            ):
+                result['indexed' if ok else 'errors'] += 1
+        finally:
+            # Restore the default refresh interval and the original replica count
+            client.indices.put_settings(
+                index=index_name,
+                body={'index': {'refresh_interval': None, 'number_of_replicas': replicas}}
+            )
+            client.indices.refresh(index=index_name)
         
         self.stdout.write(
             f'  ✓ Loaded {result["indexed"]} sample logs (errors: {result["errors"]})'
@@ -188,14 +262,16 @@ class Command(BaseCommand):
         try:
             indices_stats = elasticsearch_service.client.indices.stats(index='logops-*')
             
+            lines = []
             for index_name, stats in indices_stats['indices'].items():
                 doc_count = stats['total']['docs']['count']
                 store_size = stats['total']['store']['size_in_bytes']
                 store_size_mb = round(store_size / (1024 * 1024), 2)
                 
-                self.stdout.write(
-                    f'  {index_name}: {doc_count} documents, {store_size_mb} MB'
-                )
+                lines.append(f'  {index_name}: {doc_count} documents, {store_size_mb} MB')
+            
+            if lines:
+                self.stdout.write('\n'.join(lines))
                 
         except Exception as e:
             self.stdout.write(
@@ -12,6 +12,9 @@ urlpatterns = [
     path('api/app-config/', views.get_app_config, name='get_app_config'),
     path('api/pods/', views.get_pods, name='get_pods'),
     path('api/pod-logs/', views.get_pod_logs, name='get_pod_logs'),
+    path('api/pod-logs/full/', views.get_full_pod_logs, name='get_full_pod_logs'),
+    path('api/pod-logs/prefetch/', views.prefetch_pod_logs, name='prefetch_pod_logs'),
+    path('api/pod-logs/download/', views.download_pod_logs, name='download_pod_logs'),
     
     # AI Analysis endpoints - THESE ARE MISSING!
     path('api/summarize/', views.summarize_logs, name='summarize_logs'),
@@ -1,71 +1,298 @@
 import os
 import json
+import hashlib
 import re
 import requests
 import logging
 import subprocess
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any
 
+import numpy as np
+import orjson
 from django.shortcuts import render
 from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST, require_GET
 from django.conf import settings
 from django.core.cache import cache
+from django.utils.html import escape
 from django.core.mail import send_mail
 from django.utils.decorators import method_decorator
 from django.views import View
 
-# Import our new services
-from services.elasticsearch_service import elasticsearch_service
+# Import our new services (the Elasticsearch service is loaded on first use)
+from services.http_client import http_session
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 TOGETHER_API_KEY = os.getenv("TOGETHER_API_KEY") or getattr(settings, 'TOGETHER_API_KEY', None)
+TOGETHER_API_URL = "https://api.together.xyz/v1/chat/completions"
+TOGETHER_HEADERS = {
+    "Authorization": f"Bearer {TOGETHER_API_KEY}",
+    "Content-Type": "application/json"
+}
+# (connect, read) seconds: fail fast if the API is unreachable, allow slow generations
+TOGETHER_TIMEOUT = (5, 30)
+TOGETHER_MODEL = "meta-llama/Llama-3-8b-chat-hf"
+
+# System prompts for the Together.ai calls
+TOGETHER_COMBINED_PROMPT = """You are a senior DevOps engineer who analyzes application logs.
+Reply with a JSON object with exactly two string fields:
+"summary": a clear summary under 300 words with bullet points covering overall
+status (Success/Failure/Warning), key events, errors or warnings found,
+performance metrics if available and actionable recommendations.
+"analysis": a root cause analysis covering primary errors and their root causes,
+impact (High/Medium/Low), recommended actions, prevention strategies and a
+timeline of critical events. If no errors are found, say so and list
+optimization opportunities."""
+
+TOGETHER_SUMMARY_PROMPT = """You are an expert DevOps engineer who specializes in analyzing application logs.
+Provide a clear, concise summary that includes:
+1. Overall status (Success/Failure/Warning)
+2. Key events or operations performed
+3. Any errors or warnings found
+4. Performance metrics if available
+5. Actionable recommendations
+Keep the summary under 300 words and use bullet points for clarity."""
+
+TOGETHER_RCA_PROMPT = """You are a senior DevOps engineer specializing in root cause analysis.
+Analyze the provided logs and identify:
+1. Primary errors or failures and their root causes
+2. Impact assessment (High/Medium/Low)
+3. Recommended actions to resolve issues
+4. Prevention strategies for the future
+5. Timeline of critical events
+
+Be specific and actionable in your recommendations.
+If no errors are found, indicate successful execution and any optimization opportunities.
+Provide step-by-step remediation where applicable."""
 
 # Cache timeouts
 APP_CONFIG_CACHE_TIMEOUT = 300
 PODS_CACHE_TIMEOUT = 120
+POD_STATS_CACHE_TIMEOUT = 60
+POD_LOGS_CACHE_TIMEOUT = 300
+RECENT_LOGS_CACHE_TIMEOUT = 30
+TOGETHER_RESULT_CACHE_TIMEOUT = 600
+
+# Pods that logged within HOT_POD_WINDOW seconds are "hot" and cached only briefly;
+# callers may ask for other staleness via ?stale=, bounded to the range below
+HOT_POD_WINDOW = 60
+HOT_POD_LOGS_CACHE_TIMEOUT = 30
+POD_LOGS_STALE_MIN = 30
+POD_LOGS_STALE_MAX = 600
+
+# Log lines fetched from Elasticsearch for the pod view, and the only fields it formats
+POD_LOGS_ES_SIZE = 1000
+POD_LOG_SOURCE_FIELDS = ['@timestamp', 'timestamp', 'log_level', 'log_message', 'message', 'pod']
+
+# Lines of a long pod log sent to the browser; the rest is behind the full-logs endpoint
+POD_LOGS_HEAD_LINES = 200
+POD_LOGS_TAIL_LINES = 200
+
+# Characters of log text sent to Together.ai (roughly 2,000 Llama-3 tokens)
+TOGETHER_PROMPT_CHAR_BUDGET = 8000
+
+# Largest page a search request may ask for
+SEARCH_MAX_PAGE_SIZE = 500
+
+# Bumped whenever logs are indexed so cached unfiltered searches are dropped
+RECENT_LOGS_VERSION_KEY = 'recent_logs_version'
 SEARCH_CACHE_TIMEOUT = 60
+EMPTY_SEARCH_CACHE_TIMEOUT = 10
+SAMPLE_SEED_TIMEOUT = 300
+
+# Bulk indexing is network-bound, so use more threads than cores
+BULK_THREAD_COUNT = 12
+
+# Sample log seeding and pod log prefetches run here so views can respond without waiting on ES
+SAMPLE_SEED_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='es-samples')
+
+# Served when app/static/app_config.json is missing; encoded once at import
+FALLBACK_APP_CONFIG = {
+    "FOBPM": {
+        "clusters": ["Cluster Prod AKS 1", "Cluster Prod AKS 2", "Cluster Prod AKS 3", "Cluster Prod AKS 4"],
+        "bundles": ["Bulkdeviceenrollment", "Bulkordervalidation", "IOTSubscription"]
+    },
+    "BOBPM": {
+        "clusters": ["Cluster Prod AKS 1", "Cluster Prod AKS 2", "Cluster Prod AKS 3", "Cluster Prod AKS 4"],
+        "bundles": ["IOTSubscription", "Bulkordervalidation", "MobilitySubscription"]
+    },
+    "BRMS": {
+        "clusters": ["Cluster Prod AKS 1", "Cluster Prod AKS 2", "Cluster Prod AKS 3", "Cluster Prod AKS 4"],
+        "bundles": ["MobilityPromotionTreatmentRules", "MobilityDeviceTreatmentRules", "BusinessRules"]
+    },
+}
+FALLBACK_APP_CONFIG_BODY = orjson.dumps(FALLBACK_APP_CONFIG)
+
+# (mtime, encoded body) of the last app_config.json read
+_app_config_cache = None
+
+# (mtime, parsed dict) of the last pods_config.json read
+_pods_config_cache = None
+
+SANITIZE_FILENAME_RE = re.compile(r'[^a-zA-Z0-9_\-]')
+
+# Whole lines containing each level anywhere, matched over the whole text at once; a line
+# mentioning several levels counts for each of them
+LOG_LEVEL_LINE_RES = {
+    level: re.compile(rf'^[^\n]*{level}[^\n]*', re.MULTILINE)
+    for level in ('INFO', 'WARN', 'ERROR')
+}
+LOG_LEVEL_WORD_RE = re.compile(r'INFO|WARN|ERROR')
+
+# Log text shorter than this (placeholders, stray clicks) is never worth analyzing
+MIN_ANALYSIS_LOG_CHARS = 32
+NONBLANK_LINE_RE = re.compile(r'^[^\S\n]*\S', re.MULTILINE)
+
+# Prompt truncation keeps lines in this order of severity; anything else ranks last
+LINE_SEVERITY_RE = re.compile(r'FATAL|ERROR|WARN')
+LINE_SEVERITY_RANK = {'FATAL': 0, 'ERROR': 1, 'WARN': 2}
+
+# Root-cause keywords for generate_local_rca, matched case-insensitively in one scan
+RCA_KEYWORDS = ('timeout', 'memory', 'connection')
+RCA_KEYWORD_RE = re.compile('|'.join(RCA_KEYWORDS), re.IGNORECASE)
+
+# Lines of generated log content worth indexing: not blank, not a '#' comment
+INDEXABLE_LOG_LINE_RE = re.compile(r'^(?!#)(?=[^\n]*\S)[^\n]*', re.MULTILINE)
+
+# Sample log vocabulary for generate_specific_sample_logs. Each message is a
+# (template, value_range) pair; "{}" slots take a random value from the range
+# (inclusive for ints, continuous for floats).
+SAMPLE_LOG_LEVELS = ('INFO', 'WARN', 'ERROR')
+SAMPLE_LOG_LEVEL_WEIGHTS = (0.7, 0.2, 0.1)
+SAMPLE_STATUS_CODES = np.array([200, 201, 400, 401, 404, 500])
+
+# One generator for the process; numpy serialises concurrent draws internally
+SAMPLE_RNG = np.random.default_rng()
+SAMPLE_LOG_MESSAGES = {
+    'INFO': (
+        ('Service started successfully', None),
+        ('Processing request completed', None),
+        ('Health check passed', None),
+        ('Database connection established', None),
+        ('User authenticated successfully', None),
+        ('Request processed in {}ms', (50, 200)),
+        ('Cache hit for key: user_{}', (1000, 9999)),
+        ('Background job completed', None),
+        ('Configuration loaded successfully', None),
+        ('Transaction completed successfully', None),
+    ),
+    'WARN': (
+        ('High memory usage detected: {}%', (75, 90)),
+        ('Response time degradation: {:.1f}s', (1.5, 3.0)),
+        ('Queue backlog growing: {} pending items', (50, 200)),
+        ('Connection pool near capacity: {}%', (80, 95)),
+        ('Cache miss ratio high: {}%', (25, 45)),
+        ('Slow query detected: {}ms', (1000, 3000)),
+    ),
+    'ERROR': (
+        ('Database connection timeout after {}s', (30, 60)),
+        ('Failed to process request: connection refused', None),
+        ('Authentication failed: invalid credentials', None),
+        ('OutOfMemoryError: Java heap space', None),
+        ('Network timeout: connection reset by peer', None),
+        ('Service temporarily unavailable', None),
+        ('Invalid request format', None),
+    ),
+}
+
+
+def orjson_response(obj, status=200):
+    """JSON response encoded with orjson instead of the stdlib encoder"""
+    return HttpResponse(orjson.dumps(obj), content_type='application/json', status=status)
+
+@lru_cache(maxsize=None)
+def get_es_service():
+    """Shared Elasticsearch service, imported and constructed on first use"""
+    from services.elasticsearch_service import get_elasticsearch_service
+    return get_elasticsearch_service()
+
+@lru_cache(maxsize=None)
+def es_is_cloud() -> bool:
+    """Whether the configured Elasticsearch endpoint is Elastic Cloud"""
+    return 'cloud.es.io' in getattr(get_es_service(), 'base_url', '')
+
+def safe_int(value, default: int, lo: int = 1, hi: int = 1000) -> int:
+    """Parse an integer request parameter, clamped to [lo, hi]; default if missing or invalid"""
+    try:
+        return max(lo, min(hi, int(value)))
+    except (TypeError, ValueError):
+        return default
 
-
+@lru_cache(maxsize=4096)
 def sanitize_filename(value):
     """Sanitize filename to avoid path traversal and invalid characters."""
     if not value:
         return "unknown"
-    return re.sub(r'[^a-zA-Z0-9_\-]', '_', str(value))
+    return SANITIZE_FILENAME_RE.sub('_', str(value))
+
+@lru_cache(maxsize=1)
+def display_time_at(second: int) -> str:
+    """Local 'YYYY-MM-DD HH:MM:SS' for a Unix second, formatted once per second"""
+    return datetime.fromtimestamp(second).isoformat(sep=' ')
+
+def now_display() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', shared by every caller in the same second"""
+    return display_time_at(int(time.time()))
 
+def cache_set_text(key: str, text: str, timeout: int):
+    """Cache a log text zlib-compressed; level 1 is cheap and log text shrinks several-fold"""
+    cache.set(key, zlib.compress(text.encode('utf-8'), 1), timeout)
+
+def cache_get_text(key: str) -> Optional[str]:
+    """Read a text stored by cache_set_text, or None on a miss"""
+    compressed = cache.get(key)
+    if compressed is None:
+        return None
+    try:
+        return zlib.decompress(compressed).decode('utf-8')
+    except (zlib.error, TypeError, UnicodeDecodeError):
+        # Written before compression or by another user of the key; treat as a miss
+        cache.delete(key)
+        return None
+
+@lru_cache(maxsize=2048)
+def build_cache_key(prefix: str, *parts) -> str:
+    """Cache key made of a prefix and sanitized parts, joined with underscores"""
+    return '_'.join([prefix] + [sanitize_filename(part) for part in parts])
+
+# Map cluster values from form to ES
+CLUSTER_MAPPING = {
+    'cluster1': 'Cluster Prod AKS 1',
+    'cluster2': 'Cluster Prod AKS 2', 
+    'cluster3': 'Cluster Prod AKS 3',
+    'cluster4': 'Cluster Prod AKS 4'
+}
+
+# Map bundle values (fix casing), keyed by the lowercased form value
+BUNDLE_MAPPING = {
+    'bulkdeviceenrollment': 'Bulkdeviceenrollment',
+    'bulkordervalidation': 'Bulkordervalidation',
+    'iotsubscription': 'IOTSubscription',
+    'mobilitysubscription': 'MobilitySubscription',
+    'mobilitypromotiontreatmentrules': 'MobilityPromotionTreatmentRules',
+    'mobilitydevicetreatmentrules': 'MobilityDeviceTreatmentRules',
+    'businessrules': 'BusinessRules',
+    'customermanagement': 'CustomerManagement',
+    'inventorytracking': 'InventoryTracking',
+    'devicemanagement': 'DeviceManagement',
+    'networkmonitoring': 'NetworkMonitoring'
+}
+
+@lru_cache(maxsize=128)
 def map_frontend_to_elasticsearch_values(app, cluster, bundle, pod):
     """Map frontend form values to Elasticsearch field values"""
-    
-    # Map cluster values from form to ES
-    cluster_mapping = {
-        'cluster1': 'Cluster Prod AKS 1',
-        'cluster2': 'Cluster Prod AKS 2', 
-        'cluster3': 'Cluster Prod AKS 3',
-        'cluster4': 'Cluster Prod AKS 4'
-    }
-    
-    # Map bundle values (fix casing)
-    bundle_mapping = {
-        'bulkdeviceenrollment': 'Bulkdeviceenrollment',
-        'bulkordervalidation': 'Bulkordervalidation',
-        'iotsubscription': 'IOTSubscription',
-        'mobilitysubscription': 'MobilitySubscription',
-        'mobilitypromotiontreatmentrules': 'MobilityPromotionTreatmentRules',
-        'mobilitydevicetreatmentrules': 'MobilityDeviceTreatmentRules',
-        'businessrules': 'BusinessRules',
-        'customermanagement': 'CustomerManagement',
-        'inventorytracking': 'InventoryTracking',
-        'devicemanagement': 'DeviceManagement',
-        'networkmonitoring': 'NetworkMonitoring'
-    }
-    
-    # Apply mappings
-    mapped_cluster = cluster_mapping.get(cluster, cluster)
-    mapped_bundle = bundle_mapping.get(bundle.lower(), bundle)
+    mapped_cluster = CLUSTER_MAPPING.get(cluster, cluster)
+    mapped_bundle = BUNDLE_MAPPING.get(bundle.lower(), bundle) if bundle else bundle
     
     # Fix pod name casing (ES has lowercase pod names)
     mapped_pod = pod.lower() if pod else pod
@@ -76,39 +303,35 @@ def map_frontend_to_elasticsearch_values(app, cluster, bundle, pod):
 @csrf_exempt 
 def get_app_config(request):
     """Get application configuration with multiple apps - UPDATED FOR NEW CONFIG"""
+    global _app_config_cache
     try:
         # Try to read from static file first
         config_path = os.path.join(settings.BASE_DIR, 'app', 'static', 'app_config.json')
         
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            logger.info("✅ Loaded app config from file successfully")
-            return JsonResponse(config)
+        try:
+            mtime = os.stat(config_path).st_mtime
+        except FileNotFoundError:
+            mtime = None
+        
+        if mtime is not None:
+            # Only re-read and re-encode the file when it has changed on disk
+            cached = _app_config_cache
+            if cached is None or cached[0] != mtime:
+                with open(config_path, 'rb') as f:
+                    config = orjson.loads(f.read())
+                cached = (mtime, orjson.dumps(config))
+                _app_config_cache = cached
+                logger.info("✅ Loaded app config from file successfully")
+            return HttpResponse(cached[1], content_type='application/json')
         
         # Updated fallback config that matches your new app_config.json
         logger.warning("⚠️ App config file not found, using fallback config")
-        fallback_config = {
-            "FOBPM": {
-                "clusters": ["Cluster Prod AKS 1", "Cluster Prod AKS 2", "Cluster Prod AKS 3", "Cluster Prod AKS 4"],
-                "bundles": ["Bulkdeviceenrollment", "Bulkordervalidation", "IOTSubscription"]
-            },
-            "BOBPM": {
-                "clusters": ["Cluster Prod AKS 1", "Cluster Prod AKS 2", "Cluster Prod AKS 3", "Cluster Prod AKS 4"],
-                "bundles": ["IOTSubscription", "Bulkordervalidation", "MobilitySubscription"]
-            },
-            "BRMS": {
-                "clusters": ["Cluster Prod AKS 1", "Cluster Prod AKS 2", "Cluster Prod AKS 3", "Cluster Prod AKS 4"],
-                "bundles": ["MobilityPromotionTreatmentRules", "MobilityDeviceTreatmentRules", "BusinessRules"]
-            },
-        }
-        
-        return JsonResponse(fallback_config)
+        return HttpResponse(FALLBACK_APP_CONFIG_BODY, content_type='application/json')
         
     except Exception as e:
         logger.error(f"❌ Error getting app config: {str(e)}")
         # Emergency fallback - minimal but consistent
-        return JsonResponse({
+        return orjson_response({
             "FOBPM": {
                 "clusters": ["Cluster Prod AKS 1", "Cluster Prod AKS 2"],
                 "bundles": ["Bulkdeviceenrollment", "Bulkordervalidation"]
@@ -123,11 +346,41 @@ def get_app_config(request):
             }
         })
 
+def es_logs_cache_key(app: str, cluster: str, bundle: str, limit: int = 100) -> str:
+    """Cache key for a get_logs_from_elasticsearch_enhanced lookup"""
+    mapped_app, mapped_cluster, mapped_bundle, _ = map_frontend_to_elasticsearch_values(
+        app, cluster, bundle, None
+    )
+    return build_cache_key('eslogs', mapped_app, mapped_cluster, mapped_bundle, limit)
+
 def get_logs_from_elasticsearch_enhanced(app: str, cluster: str, bundle: str, limit: int = 100) -> Dict[str, Any]:
     """Get logs from Elasticsearch with proper value mapping - FIXED VERSION"""
+    try:
+        # Serve repeated lookups for the same combination from the cache
+        cache_key = es_logs_cache_key(app, cluster, bundle, limit)
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug("Returning cached Elasticsearch logs for %s-%s-%s", app, cluster, bundle)
+            return cached_result
+        
+        result = search_logs_with_value_fallback(app, cluster, bundle, limit)
+        
+        # Cache hits for the usual TTL; misses only briefly to absorb bursts
+        timeout = SEARCH_CACHE_TIMEOUT if result.get('logs') else EMPTY_SEARCH_CACHE_TIMEOUT
+        if 'error' not in result or result['error'] == 'No logs found':
+            cache.set(cache_key, result, timeout)
+        return result
+        
+    except Exception as e:
+        logger.error("❌ Error getting logs from Elasticsearch: %s", e)
+        return {'logs': [], 'total': 0, 'error': str(e)}
+
+def search_logs_with_value_fallback(app: str, cluster: str, bundle: str, limit: int) -> Dict[str, Any]:
+    """Search with mapped values first, then fall back to the raw form values"""
+    search = get_es_service().search_logs
     try:
         # First check if Elasticsearch is available
-        if not elasticsearch_service.is_available():
+        if not get_es_service().is_available():
             logger.error("❌ Elasticsearch is not available")
             return {'logs': [], 'total': 0, 'error': 'Elasticsearch not available'}
         
@@ -145,17 +398,17 @@ def get_logs_from_elasticsearch_enhanced(app: str, cluster: str, bundle: str, li
             'page': 1
         }
         
-        logger.info(f"🔍 Searching Elasticsearch with MAPPED params: {query_params}")
+        logger.info("🔍 Searching Elasticsearch with MAPPED params: %s", query_params)
         
         # Search in Elasticsearch with mapped values
-        result = elasticsearch_service.search_logs(query_params)
+        result = search(query_params)
         
         if result and result.get('logs') and len(result['logs']) > 0:
-            logger.info(f"✅ Found {len(result['logs'])} logs from Elasticsearch (mapped values)")
+            logger.info("✅ Found %d logs from Elasticsearch (mapped values)", len(result['logs']))
             return result
         
         # If no mapped match, try original values (fallback)
-        logger.info(f"🔍 No mapped match found, trying original values...")
+        logger.info("🔍 No mapped match found, trying original values...")
         
         original_query_params = {
             'application': app,
@@ -165,17 +418,17 @@ def get_logs_from_elasticsearch_enhanced(app: str, cluster: str, bundle: str, li
             'page': 1
         }
         
-        result_original = elasticsearch_service.search_logs(original_query_params)
+        result_original = search(original_query_params)
         
         if result_original and result_original.get('logs') and len(result_original['logs']) > 0:
-            logger.info(f"✅ Found {len(result_original['logs'])} logs from Elasticsearch (original values)")
+            logger.info("✅ Found %d logs from Elasticsearch (original values)", len(result_original['logs']))
             return result_original
         
-        logger.warning(f"⚠️ No logs found in Elasticsearch for {app}-{cluster}-{bundle} (tried both mapped and original)")
+        logger.warning("⚠️ No logs found in Elasticsearch for %s-%s-%s (tried both mapped and original)", app, cluster, bundle)
         return {'logs': [], 'total': 0, 'error': 'No logs found'}
         
     except Exception as e:
-        logger.error(f"❌ Error getting logs from Elasticsearch: {str(e)}")
+        logger.error("❌ Error getting logs from Elasticsearch: %s", e)
         return {'logs': [], 'total': 0, 'error': str(e)}
 
 @csrf_exempt
@@ -184,19 +437,18 @@ def index(request):
     context = {}
 
     if request.method == 'POST':
-        app = request.POST.get('application', '').strip()
-        cluster = request.POST.get('cluster', '').strip()
-        bundle = request.POST.get('testtype', '').strip()
+        post = request.POST
+        app, cluster, bundle = (post.get(key, '').strip() for key in ('application', 'cluster', 'testtype'))
 
-        # Validate required fields
-        if not all([app, cluster, bundle]):
+        # Validate required fields before touching the logger or Elasticsearch
+        if not (app and cluster and bundle):
             context['log'] = "❌ Error: Please select Application, Cluster, and Bundle before running the test."
             return render(request, 'app/index.html', context)
 
-        logger.info(f"🚀 Processing request for: {app} - {cluster} - {bundle}")
+        logger.info("🚀 Processing request for: %s - %s - %s", app, cluster, bundle)
 
         # FIRST: Check if Elasticsearch is available
-        if elasticsearch_service.is_available():
+        if get_es_service().is_available():
             logger.info("✅ Elasticsearch is available - searching for logs")
             
             # Try to get logs from Elasticsearch with enhanced search
@@ -209,33 +461,14 @@ def index(request):
                 context['log'] = formatted_logs
                 context['log_source'] = 'elasticsearch'
                 context['total_logs'] = es_logs.get('total', 0)
-                logger.info(f"✅ Successfully loaded {len(es_logs['logs'])} logs from Elasticsearch")
+                logger.info("✅ Successfully loaded %d logs from Elasticsearch", len(es_logs['logs']))
             else:
-                # No logs found in Elasticsearch, try to create some
-                logger.warning(f"⚠️ No logs found in Elasticsearch for {app}-{cluster}-{bundle}")
-                logger.info("📊 Creating sample data for this combination...")
-                
-                # Generate and index sample logs for this specific combination
-                sample_logs = generate_specific_sample_logs(app, cluster, bundle)
-                if sample_logs:
-                    result = elasticsearch_service.bulk_index_logs(sample_logs)
-                    logger.info(f"✅ Created {result['indexed']} sample logs")
-                    
-                    # Now try to get the logs again
-                    es_logs = get_logs_from_elasticsearch_enhanced(app, cluster, bundle)
-                    if es_logs and es_logs.get('logs'):
-                        formatted_logs = format_elasticsearch_logs(es_logs['logs'])
-                        context['log'] = formatted_logs
-                        context['log_source'] = 'elasticsearch'
-                        context['total_logs'] = es_logs.get('total', 0)
-                    else:
-                        # Still no logs, fallback
-                        logger.warning("❌ Still no logs after creating samples, using fallback")
-                        context.update(get_file_based_logs(app, cluster, bundle))
-                else:
-                    # Fallback to file-based logs
-                    logger.warning("❌ Failed to create sample logs, using fallback")
-                    context.update(get_file_based_logs(app, cluster, bundle))
+                # No logs found in Elasticsearch; seed some in the background
+                # and answer this request from the file-based fallback
+                logger.warning("⚠️ No logs found in Elasticsearch for %s-%s-%s", app, cluster, bundle)
+                if seed_sample_logs_in_background(app, cluster, bundle):
+                    logger.info("📊 Creating sample data for this combination in the background...")
+                context.update(get_file_based_logs(app, cluster, bundle))
         else:
             # Elasticsearch is not available
             logger.error("❌ Elasticsearch is not available, using fallback")
@@ -249,55 +482,95 @@ def index(request):
 
     return render(request, 'index.html', context)
 
+def seed_sample_logs_in_background(app: str, cluster: str, bundle: str) -> bool:
+    """Queue sample log seeding for a combination unless another request already did"""
+    seed_key = build_cache_key('samples_done', app, cluster, bundle)
+    
+    # cache.add only succeeds for the first caller, so concurrent requests don't all seed
+    if not cache.add(seed_key, 1, timeout=SAMPLE_SEED_TIMEOUT):
+        logger.info("⏳ Sample logs for %s-%s-%s already being seeded", app, cluster, bundle)
+        return False
+    
+    SAMPLE_SEED_EXECUTOR.submit(seed_sample_logs, app, cluster, bundle, seed_key)
+    return True
+
+def seed_sample_logs(app: str, cluster: str, bundle: str, seed_key: str):
+    """Generate and index sample logs for a combination (runs on SAMPLE_SEED_EXECUTOR)"""
+    try:
+        sample_logs = generate_specific_sample_logs(app, cluster, bundle)
+        if not sample_logs:
+            cache.delete(seed_key)
+            return
+        
+        result = get_es_service().parallel_bulk_index(sample_logs, chunk_size=100, thread_count=BULK_THREAD_COUNT)
+        if result.get('error') or not result['indexed']:
+            # parallel_bulk_index reports failures instead of raising; let the next request retry
+            cache.delete(seed_key)
+            logger.error("❌ Sample logs for %s-%s-%s were not indexed: %s",
+                         app, cluster, bundle, result.get('error', 'no documents indexed'))
+            return
+        logger.info("✅ Created %s sample logs", result['indexed'])
+        invalidate_recent_logs()
+        
+        # Drop the cached empty result so the next request sees the new logs
+        cache.delete(es_logs_cache_key(app, cluster, bundle))
+    except Exception as e:
+        cache.delete(seed_key)
+        logger.error("❌ Error seeding sample logs for %s-%s-%s: %s", app, cluster, bundle, e)
+
+def iter_elasticsearch_log_lines(logs: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the formatted header and log lines one at a time"""
+    # Enhanced header to show cloud vs local
+    is_cloud = es_is_cloud()
+    source_type = "☁️ Cloud Elasticsearch" if is_cloud else "🏠 Local Elasticsearch"
+    
+    yield "# ===================================="
+    yield "# Source: elasticsearch"
+    yield f"# Type: {source_type}"
+    yield f"# Total logs: {len(logs)}"
+    yield f"# Retrieved: {now_display()}"
+    if is_cloud:
+        yield "# Endpoint: Elastic Cloud"
+    yield "# ===================================="
+    yield ""
+    
+    for log in logs:
+        # Only look up the fallback field when the primary one is missing
+        get = log.get
+        timestamp = get('@timestamp') or get('timestamp') or ''
+        level = get('log_level', 'INFO')
+        message = get('log_message') or get('message') or ''
+        pod = get('pod', '')
+        
+        # Format timestamp properly - ES emits fixed-layout ISO 8601, so slice it
+        if isinstance(timestamp, str) and 'T' in timestamp:
+            if len(timestamp) >= 19 and timestamp[10] == 'T':
+                timestamp = f"{timestamp[:10]} {timestamp[11:19]}"
+            else:
+                try:
+                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                    timestamp = dt.strftime('%Y-%m-%d %H:%M:%S')
+                except ValueError:
+                    pass
+        
+        # Format similar to original log format
+        if timestamp and level and message:
+            formatted_line = f"[{timestamp}] {level}: {message}"
+            if pod:
+                formatted_line += f" [pod: {pod}]"
+            yield formatted_line
+
 def format_elasticsearch_logs(logs: List[Dict[str, Any]]) -> str:
     """Format Elasticsearch logs for display - ENHANCED FOR CLOUD"""
     try:
         if not logs:
             return "No logs found in Elasticsearch"
-            
-        formatted_lines = []
-        
-        # Enhanced header to show cloud vs local
-        es_host = getattr(elasticsearch_service, 'base_url', 'Unknown')
-        is_cloud = 'cloud.es.io' in es_host
-        source_type = "☁️ Cloud Elasticsearch" if is_cloud else "🏠 Local Elasticsearch"
-        
-        formatted_lines.append("# ====================================")
-        formatted_lines.append("# Source: elasticsearch")
-        formatted_lines.append(f"# Type: {source_type}")
-        formatted_lines.append(f"# Total logs: {len(logs)}")
-        formatted_lines.append(f"# Retrieved: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        if is_cloud:
-            formatted_lines.append("# Endpoint: Elastic Cloud")
-        formatted_lines.append("# ====================================")
-        formatted_lines.append("")
-        
-        for log in logs:
-            timestamp = log.get('@timestamp', log.get('timestamp', ''))
-            level = log.get('log_level', 'INFO')
-            message = log.get('log_message', log.get('message', ''))
-            pod = log.get('pod', '')
-            
-            # Format timestamp properly
-            if timestamp:
-                try:
-                    if 'T' in timestamp:
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        timestamp = dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    pass
-            
-            # Format similar to original log format
-            if timestamp and level and message:
-                formatted_line = f"[{timestamp}] {level}: {message}"
-                if pod:
-                    formatted_line += f" [pod: {pod}]"
-                formatted_lines.append(formatted_line)
         
-        return "\n".join(formatted_lines)
+        # Join straight from the generator so no intermediate list is built
+        return "\n".join(iter_elasticsearch_log_lines(logs))
         
     except Exception as e:
-        logger.error(f"❌ Error formatting Elasticsearch logs: {str(e)}")
+        logger.error("❌ Error formatting Elasticsearch logs: %s", e)
         return f"Error formatting logs: {str(e)}"
 
 @require_GET
@@ -305,12 +578,13 @@ def format_elasticsearch_logs(logs: List[Dict[str, Any]]) -> str:
 def connection_status(request):
     """Get current connection status for debugging"""
     try:
+        es = get_es_service()
         status = {
             'elasticsearch': {
-                'available': elasticsearch_service.is_available(),
-                'host': getattr(elasticsearch_service, 'base_url', 'Unknown'),
-                'is_cloud': 'cloud.es.io' in getattr(elasticsearch_service, 'base_url', ''),
-                'auth_configured': hasattr(elasticsearch_service, 'auth_headers')
+                'available': get_es_service().is_available(),
+                'host': getattr(es, 'base_url', 'Unknown'),
+                'is_cloud': es_is_cloud(),
+                'auth_configured': hasattr(es, 'auth_headers')
             },
             'together_ai': {
                 'configured': bool(TOGETHER_API_KEY),
@@ -324,102 +598,103 @@ def connection_status(request):
         }
         
         # Test Elasticsearch connection
-        if elasticsearch_service.is_available():
+        if get_es_service().is_available():
             try:
-                health = elasticsearch_service.get_health_status()
+                health = es.get_health_status()
                 status['elasticsearch']['cluster_name'] = health.get('cluster_name', 'Unknown')
                 status['elasticsearch']['status'] = health.get('status', 'Unknown')
             except Exception as e:
                 status['elasticsearch']['error'] = str(e)
         
-        return JsonResponse(status)
+        return orjson_response(status)
         
     except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
-
-def generate_specific_sample_logs(app: str, cluster: str, bundle: str) -> List[Dict[str, Any]]:
-    """Generate sample logs for a specific app/cluster/bundle combination"""
-    import random
+        return orjson_response({'error': str(e)}, status=500)
+
+@dataclass
+class SampleLog:
+    """One generated sample log; expanded to an ES document only when indexed"""
+    __slots__ = ('timestamp', 'application', 'cluster', 'bundle', 'pod',
+                 'log_level', 'message', 'response_time', 'status_code')
+    timestamp: str
+    application: str
+    cluster: str
+    bundle: str
+    pod: str
+    log_level: str
+    message: str
+    response_time: Optional[float]
+    status_code: Optional[int]
     
-    try:
-        log_messages = {
-            'INFO': [
-                'Service started successfully',
-                'Processing request completed',
-                'Health check passed',
-                'Database connection established',
-                'User authenticated successfully',
-                f'Request processed in {random.randint(50, 200)}ms',
-                f'Cache hit for key: user_{random.randint(1000, 9999)}',
-                'Background job completed',
-                'Configuration loaded successfully',
-                'Transaction completed successfully'
-            ],
-            'WARN': [
-                f'High memory usage detected: {random.randint(75, 90)}%',
-                f'Response time degradation: {random.uniform(1.5, 3.0):.1f}s',
-                f'Queue backlog growing: {random.randint(50, 200)} pending items',
-                f'Connection pool near capacity: {random.randint(80, 95)}%',
-                f'Cache miss ratio high: {random.randint(25, 45)}%',
-                f'Slow query detected: {random.randint(1000, 3000)}ms'
-            ],
-            'ERROR': [
-                f'Database connection timeout after {random.randint(30, 60)}s',
-                'Failed to process request: connection refused',
-                'Authentication failed: invalid credentials',
-                'OutOfMemoryError: Java heap space',
-                'Network timeout: connection reset by peer',
-                'Service temporarily unavailable',
-                'Invalid request format'
-            ]
+    def to_document(self) -> Dict[str, Any]:
+        """Elasticsearch document with the duplicated timestamp/message fields"""
+        document = {
+            '@timestamp': self.timestamp,
+            'timestamp': self.timestamp,
+            'application': self.application,
+            'cluster': self.cluster,
+            'bundle': self.bundle,
+            'pod': self.pod,
+            'log_level': self.log_level,
+            'log_message': self.message,
+            'message': self.message,
+            'source_file': 'elasticsearch'
         }
-        
+        if self.response_time is not None:
+            document['response_time'] = self.response_time
+        if self.status_code is not None:
+            document['status_code'] = self.status_code
+        return document
+
+def format_sample_message(template: str, value_range, draw: float) -> str:
+    """Fill a sample message template using a uniform draw in [0, 1)"""
+    if value_range is None:
+        return template
+    low, high = value_range
+    if isinstance(low, float):
+        return template.format(low + draw * (high - low))
+    return template.format(low + int(draw * (high - low + 1)))
+
+def generate_specific_sample_logs(app: str, cluster: str, bundle: str) -> List[SampleLog]:
+    """Generate sample logs for a specific app/cluster/bundle combination"""
+    try:
+        rng = SAMPLE_RNG
         sample_logs = []
-        base_time = datetime.now() - timedelta(hours=2)
+        base_time = np.datetime64(datetime.now() - timedelta(hours=2))
         
         # Generate 3 pods for this specific combination
         for pod_num in range(1, 4):
             pod_name = f"{app.lower()}-{bundle.lower()}-web-{pod_num:03d}"
             
-            # Generate 20-30 logs per pod
-            log_count = random.randint(20, 30)
+            # Generate 20-30 logs per pod, drawing every random field in one call each
+            log_count = int(rng.integers(20, 31))
             
-            for _ in range(log_count):
-                # Random time within the last 2 hours
-                log_time = base_time + timedelta(
-                    minutes=random.randint(0, 120),
-                    seconds=random.randint(0, 59)
-                )
-                
-                # Weight log levels: 70% INFO, 20% WARN, 10% ERROR
-                level = random.choices(
-                    ['INFO', 'WARN', 'ERROR'],
-                    weights=[70, 20, 10]
-                )[0]
-                
-                # Select message
-                message = random.choice(log_messages[level])
-                
-                # Create log entry
-                log_entry = {
-                    '@timestamp': log_time.isoformat(),
-                    'timestamp': log_time.isoformat(),
-                    'application': app,
-                    'cluster': cluster,
-                    'bundle': bundle,
-                    'pod': pod_name,
-                    'log_level': level,
-                    'log_message': message,
-                    'message': message,
-                    'source_file': 'elasticsearch'
-                }
-                
-                # Add performance metrics occasionally
-                if random.random() < 0.3:
-                    log_entry['response_time'] = round(random.uniform(0.1, 2.0), 3)
+            # Weight log levels: 70% INFO, 20% WARN, 10% ERROR
+            level_idx = rng.choice(len(SAMPLE_LOG_LEVELS), size=log_count, p=SAMPLE_LOG_LEVEL_WEIGHTS).tolist()
+            message_draws = rng.random(log_count).tolist()
+            value_draws = rng.random(log_count).tolist()
+            
+            # Random time within the last 2 hours
+            offsets = rng.integers(0, 121 * 60, size=log_count)
+            timestamps = (base_time + offsets.astype('timedelta64[s]')).astype(str).tolist()
+            
+            # Add performance metrics occasionally
+            has_response_time = (rng.random(log_count) < 0.3).tolist()
+            response_times = np.round(rng.uniform(0.1, 2.0, size=log_count), 3).tolist()
+            has_status_code = (rng.random(log_count) < 0.2).tolist()
+            status_codes = rng.choice(SAMPLE_STATUS_CODES, size=log_count).tolist()
+            
+            for i in range(log_count):
+                level = SAMPLE_LOG_LEVELS[level_idx[i]]
+                templates = SAMPLE_LOG_MESSAGES[level]
+                template, value_range = templates[int(message_draws[i] * len(templates))]
+                message = format_sample_message(template, value_range, value_draws[i])
                 
-                if random.random() < 0.2:
-                    log_entry['status_code'] = random.choice([200, 201, 400, 401, 404, 500])
+                log_entry = SampleLog(
+                    timestamps[i], app, cluster, bundle, pod_name, level, message,
+                    response_times[i] if has_response_time[i] else None,
+                    status_codes[i] if has_status_code[i] else None
+                )
                 
                 sample_logs.append(log_entry)
         
@@ -444,21 +719,21 @@ def get_file_based_logs(app: str, cluster: str, bundle: str) -> Dict[str, Any]:
     simple_log_path = os.path.join("app", "static", "logs", simple_log_name)
 
     try:
-        if os.path.exists(simple_log_path):
-            with open(simple_log_path, "r", encoding='utf-8') as f:
-                log_content = f.read()
-            context['log'] = log_content
-            context['log_file_name'] = simple_log_name
-            context['log_source'] = 'file'
-            logger.info(f"Successfully loaded log file: {simple_log_path}")
-        elif os.path.exists(log_file_path):
-            with open(log_file_path, "r", encoding='utf-8') as f:
-                log_content = f.read()
+        # Open the candidates directly; a missing file costs one failed open
+        log_content = None
+        for candidate_name, candidate_path in ((simple_log_name, simple_log_path), (log_file_name, log_file_path)):
+            try:
+                with open(candidate_path, "r", encoding='utf-8') as f:
+                    log_content = f.read()
+            except FileNotFoundError:
+                continue
             context['log'] = log_content
-            context['log_file_name'] = log_file_name
+            context['log_file_name'] = candidate_name
             context['log_source'] = 'file'
-            logger.info(f"Successfully loaded log file: {log_file_path}")
-        else:
+            logger.info(f"Successfully loaded log file: {candidate_path}")
+            break
+        
+        if log_content is None:
             # Auto-generate logs
             log_content = auto_generate_pod_logs(app, cluster, bundle, f"{app}-{bundle}-pod")
             
@@ -468,7 +743,7 @@ def get_file_based_logs(app: str, cluster: str, bundle: str) -> Dict[str, Any]:
 # Application: {app}
 # Cluster: {cluster}
 # Bundle: {bundle}
-# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+# Generated: {now_display()}
 # ====================================
 
 """
@@ -489,35 +764,58 @@ def get_file_based_logs(app: str, cluster: str, bundle: str) -> Dict[str, Any]:
 
     return context
 
+def iter_generated_log_entries(log_content: str, app: str, cluster: str, bundle: str) -> Iterator[bytes]:
+    """Yield a serialized ES document for each non-comment line of generated log content"""
+    # One indexing pass shares a single timestamp and pod name, so every field
+    # except the message is encoded once and only the line is spliced in
+    ts = datetime.now().isoformat()
+    prefix = orjson.dumps({
+        '@timestamp': ts,
+        'timestamp': ts,
+        'application': app,
+        'cluster': cluster,
+        'bundle': bundle,
+        'pod': f"{app}-{bundle}-pod",
+        'log_level': 'INFO',
+        'source_file': 'auto-generated'
+    })[:-1] + b',"log_message":'
+    
+    # finditer scans the original string lazily; only the current line is copied
+    for match in INDEXABLE_LOG_LINE_RE.finditer(log_content):
+        line = orjson.dumps(match.group())
+        yield prefix + line + b',"message":' + line + b'}'
+
+def index_generated_logs_in_background(log_content: str, app: str, cluster: str, bundle: str):
+    """Index generated logs on SAMPLE_SEED_EXECUTOR so the pod log response doesn't wait on ES"""
+    SAMPLE_SEED_EXECUTOR.submit(index_generated_logs_to_elasticsearch, log_content, app, cluster, bundle)
+
 def index_generated_logs_to_elasticsearch(log_content: str, app: str, cluster: str, bundle: str):
     """Index newly generated logs to Elasticsearch"""
     try:
-        lines = log_content.strip().split('\n')
-        log_entries = []
-        
-        for line in lines:
-            if line.strip() and not line.startswith('#'):
-                log_entry = {
-                    '@timestamp': datetime.now().isoformat(),
-                    'timestamp': datetime.now().isoformat(),
-                    'log_message': line,
-                    'message': line,
-                    'application': app,
-                    'cluster': cluster,
-                    'bundle': bundle,
-                    'pod': f"{app}-{bundle}-pod",
-                    'log_level': 'INFO',
-                    'source_file': 'auto-generated'
-                }
-                log_entries.append(log_entry)
-        
-        if log_entries:
-            result = elasticsearch_service.bulk_index_logs(log_entries)
+        # A generated pod log is a handful of lines, one _bulk chunk, so a single
+        # worker thread is enough; entries are still generated lazily
+        result = get_es_service().parallel_bulk_index(
+            iter_generated_log_entries(log_content, app, cluster, bundle),
+            thread_count=1
+        )
+        if result['indexed']:
             logger.info(f"Indexed {result['indexed']} generated logs to Elasticsearch")
+            invalidate_recent_logs()
             
     except Exception as e:
         logger.error(f"Error indexing generated logs: {str(e)}")
 
+def recent_logs_version() -> int:
+    """Current generation of the cached unfiltered search results"""
+    return cache.get_or_set(RECENT_LOGS_VERSION_KEY, 1, None)
+
+def invalidate_recent_logs():
+    """Make cached unfiltered search results stale after new logs are indexed"""
+    try:
+        cache.incr(RECENT_LOGS_VERSION_KEY)
+    except ValueError:
+        pass
+
 @require_POST
 @csrf_exempt
 def search_logs_elasticsearch(request):
@@ -532,8 +830,10 @@ def search_logs_elasticsearch(request):
         log_level = request.POST.get('log_level', '').strip()
         start_time = request.POST.get('start_time', '').strip()
         end_time = request.POST.get('end_time', '').strip()
-        page = int(request.POST.get('page', 1))
-        size = int(request.POST.get('size', 50))
+        page = safe_int(request.POST.get('page'), 1)
+        size = safe_int(request.POST.get('size'), 50, hi=SEARCH_MAX_PAGE_SIZE)
+        search_after = request.POST.get('search_after', '').strip()
+        hours = safe_int(request.POST.get('hours'), 0, lo=0, hi=24 * 365)
         
         # Build query parameters
         query_params = {
@@ -541,6 +841,10 @@ def search_logs_elasticsearch(request):
             'size': size
         }
         
+        # Cursor from a previous response's 'search_after' takes precedence over page
+        if search_after:
+            query_params['search_after'] = json.loads(search_after)
+        
         if search_text:
             query_params['search_text'] = search_text
         if application:
@@ -557,9 +861,20 @@ def search_logs_elasticsearch(request):
             query_params['start_time'] = start_time
         if end_time:
             query_params['end_time'] = end_time
-        
-        # Search in Elasticsearch
-        result = elasticsearch_service.search_logs(query_params)
+        if hours:
+            query_params['hours'] = hours
+        
+        # Search in Elasticsearch; the unfiltered dashboard view is served from cache
+        if not (search_text or application or cluster or bundle or pod or log_level
+                or start_time or end_time or hours or search_after):
+            recent_key = build_cache_key('recent_logs', recent_logs_version(), page, size)
+            result = cache.get(recent_key)
+            if result is None:
+                result = get_es_service().search_logs(query_params)
+                if not result.get('error'):
+                    cache.set(recent_key, result, RECENT_LOGS_CACHE_TIMEOUT)
+        else:
+            result = get_es_service().search_logs(query_params)
         
         if result.get('error'):
             return JsonResponse({
@@ -568,31 +883,43 @@ def search_logs_elasticsearch(request):
                 'logs': []
             })
         
-        # Format logs for frontend
-        formatted_logs = []
-        for log in result.get('logs', []):
-            formatted_log = {
-                'id': log.get('_id'),
-                'timestamp': log.get('@timestamp', log.get('timestamp')),
-                'application': log.get('application'),
-                'cluster': log.get('cluster'),
-                'bundle': log.get('bundle'),
-                'pod': log.get('pod'),
-                'log_level': log.get('log_level'),
-                'message': log.get('log_message', log.get('message')),
-                'response_time': log.get('response_time'),
-                'status_code': log.get('status_code'),
-                'error_type': log.get('error_type')
+        # Format logs for frontend (log.get bound once per hit)
+        formatted_logs = [
+            {
+                'id': get('_id'),
+                'timestamp': get('@timestamp') or get('timestamp'),
+                'application': get('application'),
+                'cluster': get('cluster'),
+                'bundle': get('bundle'),
+                'pod': get('pod'),
+                'log_level': get('log_level'),
+                'message': get('log_message') or get('message'),
+                'response_time': get('response_time'),
+                'status_code': get('status_code'),
+                'error_type': get('error_type')
             }
-            formatted_logs.append(formatted_log)
+            for get in (log.get for log in result.get('logs', []))
+        ]
+        
+        total = result.get('total', 0)
+        total_relation = result.get('total_relation')
+        pages = result.get('pages', 1)
+        if total is None:
+            # Cursor pages skip the recount; clients send the first page's total back with the cursor
+            from services.elasticsearch_service import TRACK_TOTAL_HITS_LIMIT
+            total = safe_int(request.POST.get('total'), 0, lo=0, hi=TRACK_TOTAL_HITS_LIMIT)
+            total_relation = request.POST.get('total_relation') or 'eq'
+            pages = max(1, -(-total // size))
         
         return JsonResponse({
             'success': True,
             'logs': formatted_logs,
-            'total': result.get('total', 0),
+            'total': total,
+            'total_relation': total_relation,
             'page': result.get('page', 1),
-            'pages': result.get('pages', 1),
-            'size': result.get('size', size)
+            'pages': pages,
+            'size': result.get('size', size),
+            'search_after': result.get('search_after')
         })
         
     except Exception as e:
@@ -620,12 +947,12 @@ def get_pods(request):
             }, status=400)
 
         # Create cache key for this specific combination
-        cache_key = f"pods_{sanitize_filename(app)}_{sanitize_filename(cluster)}_{sanitize_filename(bundle)}"
+        cache_key = build_cache_key('pods', app, cluster, bundle)
         
         # Try to get from cache first
         cached_pods = cache.get(cache_key)
         if cached_pods:
-            logger.debug(f"Returning cached pods for {app}-{cluster}-{bundle}")
+            logger.debug("Returning cached pods for %s-%s-%s", app, cluster, bundle)
             return JsonResponse({"pods": cached_pods})
 
         # Try to get pods from Elasticsearch first
@@ -633,7 +960,7 @@ def get_pods(request):
         
         if es_pods:
             pods = es_pods
-            logger.info(f"Found {len(pods)} pods from Elasticsearch for {app}-{cluster}-{bundle}")
+            logger.info("Found %d pods from Elasticsearch for %s-%s-%s", len(pods), app, cluster, bundle)
         else:
             # Fallback to configuration file
             pods = get_pods_from_config(app, cluster, bundle)
@@ -641,20 +968,28 @@ def get_pods(request):
             if not pods:
                 # Generate sample pods
                 pods = generate_sample_pods(app, bundle)
-                logger.info(f"Generated {len(pods)} sample pods for {app}-{cluster}-{bundle}")
+                logger.info("Generated %d sample pods for %s-%s-%s", len(pods), app, cluster, bundle)
 
         # Cache the pods for future requests
         cache.set(cache_key, pods, PODS_CACHE_TIMEOUT)
         
+        # Fetch every listed pod's logs in one multi-search while the user picks a pod
+        prefetch_pod_logs_in_background(app, cluster, bundle, [pod['name'] for pod in pods])
+        
         return JsonResponse({"pods": pods})
 
     except Exception as e:
-        logger.error(f"Error getting pods: {str(e)}")
+        logger.error("Error getting pods: %s", e)
         return JsonResponse({
             "error": f"Failed to get pods: {str(e)}",
             "pods": []
         }, status=500)
 
+@lru_cache(maxsize=4096)
+def pod_display_name(pod_name: str) -> str:
+    """User-friendly display name for a pod"""
+    return pod_name.replace('-', ' ').title()
+
 def get_pods_from_elasticsearch(app: str, cluster: str, bundle: str) -> List[Dict[str, str]]:
     """Get unique pod names from Elasticsearch with proper mapping"""
     try:
@@ -670,53 +1005,64 @@ def get_pods_from_elasticsearch(app: str, cluster: str, bundle: str) -> List[Dic
             'bundle': mapped_bundle
         }
         
-        logger.info(f"🔍 Getting pods from ES with mapped values: {query_params}")
+        logger.info("🔍 Getting pods from ES with mapped values: %s", query_params)
         
-        stats = elasticsearch_service.get_log_statistics(query_params)
+        # Share the aggregation between concurrent cache misses for the same combination
+        stats_key = build_cache_key('es_stats', mapped_app, mapped_cluster, mapped_bundle)
+        stats = cache.get(stats_key)
+        if stats is None:
+            stats = get_es_service().get_log_statistics(query_params, aggregations=('pods',))
+            if stats and 'error' not in stats:
+                cache.set(stats_key, stats, POD_STATS_CACHE_TIMEOUT)
         
         if stats and 'pods' in stats:
-            pods = []
-            for pod_name, count in stats['pods'].items():
-                # Create user-friendly display name
-                display_name = pod_name.replace('-', ' ').title()
-                display_name = f"{display_name} ({count} logs)"
-                
-                pods.append({
-                    "name": pod_name,  # Keep original pod name for searches
-                    "display_name": display_name
-                })
+            # Keep the original pod name for searches, show a friendly one
+            pods = [
+                {"name": pod_name, "display_name": f"{pod_display_name(pod_name)} ({count} logs)"}
+                for pod_name, count in stats['pods'].items()
+            ]
             
-            logger.info(f"✅ Found {len(pods)} pods from Elasticsearch")
+            logger.info("✅ Found %d pods from Elasticsearch", len(pods))
             return pods
         
         logger.warning("⚠️ No pods found in Elasticsearch statistics")
         return []
         
     except Exception as e:
-        logger.error(f"Error getting pods from Elasticsearch: {str(e)}")
+        logger.error("Error getting pods from Elasticsearch: %s", e)
         return []
 
 def get_pods_from_config(app: str, cluster: str, bundle: str) -> List[Dict[str, str]]:
     """Get pods from configuration file"""
+    global _pods_config_cache
     try:
         pods_config_path = os.path.join("app", "static", "pods_config.json")
         
-        if os.path.exists(pods_config_path):
-            with open(pods_config_path, 'r', encoding='utf-8') as f:
-                pods_config = json.load(f)
-            
-            # Navigate through the configuration hierarchy
-            app_config = pods_config.get(app, {})
-            cluster_config = app_config.get(cluster, {})
-            bundle_pods = cluster_config.get(bundle, [])
-            
-            if isinstance(bundle_pods, list):
-                return bundle_pods
+        try:
+            mtime = os.stat(pods_config_path).st_mtime
+        except FileNotFoundError:
+            return []
+        
+        # Only re-read and re-parse the file when it has changed on disk
+        cached = _pods_config_cache
+        if cached is None or cached[0] != mtime:
+            with open(pods_config_path, 'rb') as f:
+                cached = (mtime, orjson.loads(f.read()))
+            _pods_config_cache = cached
+        pods_config = cached[1]
+        
+        # Navigate through the configuration hierarchy
+        app_config = pods_config.get(app, {})
+        cluster_config = app_config.get(cluster, {})
+        bundle_pods = cluster_config.get(bundle, [])
+        
+        if isinstance(bundle_pods, list):
+            return bundle_pods
         
         return []
         
     except Exception as e:
-        logger.error(f"Error reading pods config: {str(e)}")
+        logger.error("Error reading pods config: %s", e)
         return []
 
 @require_POST
@@ -731,22 +1077,23 @@ def get_pod_logs(request):
 
         # Validate required fields
         if not all([app, cluster, bundle, pod]):
-            return JsonResponse({
+            return orjson_response({
                 "error": "Missing required parameters",
                 "logs": ""
             }, status=400)
 
         # Create cache key for this specific pod logs
-        cache_key = f"pod_logs_{sanitize_filename(app)}_{sanitize_filename(cluster)}_{sanitize_filename(bundle)}_{sanitize_filename(pod)}"
+        cache_key = build_cache_key('pod_logs', app, cluster, bundle, pod)
         
         # Try to get from cache first
-        cached_logs = cache.get(cache_key)
+        cached_logs = cache_get_text(cache_key)
         if cached_logs:
-            logger.debug(f"Returning cached logs for pod {pod}")
-            return JsonResponse({"logs": cached_logs})
+            logger.debug("Returning cached logs for pod %s", pod)
+            return pod_logs_response(cached_logs, cache_key)
 
         # Try to get logs from Elasticsearch first
-        es_logs = get_pod_logs_from_elasticsearch(app, cluster, bundle, pod)
+        timeout = pod_logs_cache_timeout(request, app, cluster, bundle, pod)
+        es_logs = get_pod_logs_from_elasticsearch(app, cluster, bundle, pod, timeout)
         
         if es_logs:
             log_content = es_logs
@@ -761,10 +1108,10 @@ def get_pod_logs(request):
                 found_log_source = "auto-generated"
                 
                 # Index generated logs
-                index_generated_logs_to_elasticsearch(log_content, app, cluster, bundle)
+                index_generated_logs_in_background(log_content, app, cluster, bundle)
 
         # Add metadata to logs
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = now_display()
         log_metadata = f"""# LogOps - Enhanced Log Viewer
 # Loaded: {timestamp}
 # Source: {found_log_source}
@@ -778,19 +1125,91 @@ def get_pod_logs(request):
         
         final_log_content = log_metadata + log_content
 
-        # Cache the logs for a short time
-        cache.set(cache_key, final_log_content, 30)
+        # The ES lookup may have just found the pod hot
+        if es_logs and cache.get(hot_pod_cache_key(app, cluster, bundle, pod)):
+            timeout = min(timeout, HOT_POD_LOGS_CACHE_TIMEOUT)
+        cache_set_text(cache_key, final_log_content, timeout)
         
-        return JsonResponse({"logs": final_log_content})
+        return pod_logs_response(final_log_content, cache_key)
 
     except Exception as e:
-        logger.error(f"Error getting pod logs: {str(e)}")
-        return JsonResponse({
+        logger.error("Error getting pod logs: %s", e)
+        return orjson_response({
             "error": f"Failed to get pod logs: {str(e)}",
             "logs": f"Error loading logs for pod {pod}: {str(e)}"
         }, status=500)
 
-def get_pod_logs_from_elasticsearch(app: str, cluster: str, bundle: str, pod: str) -> Optional[str]:
+def truncate_log_window(text: str, head: int = POD_LOGS_HEAD_LINES, tail: int = POD_LOGS_TAIL_LINES) -> Optional[str]:
+    """First `head` and last `tail` lines with an omission marker; None if nothing would be cut"""
+    # Counting newlines is cheaper than splitting when the text is already short enough
+    if text.count('\n') <= head + tail:
+        return None
+    lines = text.split('\n')
+    omitted = len(lines) - head - tail
+    return '\n'.join(lines[:head] + [f"... ({omitted} lines omitted) ..."] + lines[-tail:])
+
+def pod_logs_response(log_content: str, cache_key: str):
+    """Pod logs JSON; long logs are cut to head and tail, the full text stays fetchable by token"""
+    truncated = truncate_log_window(log_content)
+    if truncated is None:
+        return orjson_response({"logs": log_content})
+    return orjson_response({"logs": truncated, "truncated": True, "full_token": cache_key})
+
+@require_GET
+@csrf_exempt
+def get_full_pod_logs(request):
+    """Full pod log text for a full_token returned by get_pod_logs, while it is cached"""
+    token = request.GET.get('token', '').strip()
+    # Tokens are pod_logs cache keys; refuse anything else so other entries can't be read
+    if not token.startswith('pod_logs_'):
+        return orjson_response({"error": "Invalid token", "logs": ""}, status=400)
+    
+    full_logs = cache_get_text(token)
+    if full_logs is None:
+        return orjson_response({"error": "Logs expired, reload the pod", "logs": ""}, status=404)
+    return orjson_response({"logs": full_logs})
+
+def es_pod_logs_cache_key(mapped_app: str, mapped_cluster: str, mapped_bundle: str, mapped_pod: str,
+                          size: int = POD_LOGS_ES_SIZE) -> str:
+    """Cache key for one pod's formatted ES logs, on already-mapped values"""
+    return build_cache_key('es_pod_logs', mapped_app, mapped_cluster, mapped_bundle, mapped_pod, size)
+
+def is_recent_timestamp(timestamp: Any, window: int = HOT_POD_WINDOW) -> bool:
+    """Whether an ES ISO 8601 timestamp is within the last `window` seconds"""
+    if not isinstance(timestamp, str):
+        return False
+    try:
+        moment = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    now = datetime.now(moment.tzinfo) if moment.tzinfo else datetime.now()
+    return (now - moment).total_seconds() <= window
+
+def hot_pod_cache_key(app: str, cluster: str, bundle: str, pod: str) -> str:
+    """Marker key set while a pod has recent log activity"""
+    return build_cache_key('hot_pod', *map_frontend_to_elasticsearch_values(app, cluster, bundle, pod))
+
+def pod_logs_cache_timeout(request, app: str, cluster: str, bundle: str, pod: str) -> int:
+    """Requested staleness (?stale=300 or 300s), clamped; hot pods never exceed the short TTL"""
+    stale = (request.POST.get('stale') or request.GET.get('stale') or '').strip().rstrip('s')
+    timeout = safe_int(stale, POD_LOGS_CACHE_TIMEOUT, lo=POD_LOGS_STALE_MIN, hi=POD_LOGS_STALE_MAX)
+    if cache.get(hot_pod_cache_key(app, cluster, bundle, pod)):
+        return min(timeout, HOT_POD_LOGS_CACHE_TIMEOUT)
+    return timeout
+
+def cache_es_pod_logs(app: str, cluster: str, bundle: str, pod: str, es_key: str,
+                      logs: List[Dict], timeout: int = POD_LOGS_CACHE_TIMEOUT) -> str:
+    """Format and cache one pod's ES logs (newest first); a pod that just logged is hot, so keep its cache short"""
+    newest = logs[0]
+    if is_recent_timestamp(newest.get('@timestamp') or newest.get('timestamp')):
+        cache.set(hot_pod_cache_key(app, cluster, bundle, pod), True, HOT_POD_WINDOW)
+        timeout = min(timeout, HOT_POD_LOGS_CACHE_TIMEOUT)
+    formatted = format_elasticsearch_logs(logs)
+    cache_set_text(es_key, formatted, timeout)
+    return formatted
+
+def get_pod_logs_from_elasticsearch(app: str, cluster: str, bundle: str, pod: str,
+                                    timeout: int = POD_LOGS_CACHE_TIMEOUT) -> Optional[str]:
     """Get pod logs from Elasticsearch with proper mapping"""
     try:
         # Map the values
@@ -803,23 +1222,133 @@ def get_pod_logs_from_elasticsearch(app: str, cluster: str, bundle: str, pod: st
             'cluster': mapped_cluster,
             'bundle': mapped_bundle,
             'pod': mapped_pod,
-            'size': 1000,  # Get more logs for pod view
-            'page': 1
+            'size': POD_LOGS_ES_SIZE,  # Get more logs for pod view
+            'page': 1,
+            'source_fields': POD_LOG_SOURCE_FIELDS
         }
         
-        logger.info(f"🔍 Searching pod logs with mapped values: {query_params}")
+        # Keyed on the mapped values, so equivalent form values share one ES query
+        es_key = es_pod_logs_cache_key(mapped_app, mapped_cluster, mapped_bundle, mapped_pod, query_params['size'])
+        formatted = cache_get_text(es_key)
+        if formatted is not None:
+            return formatted
+        
+        logger.info("🔍 Searching pod logs with mapped values: %s", query_params)
         
-        result = elasticsearch_service.search_logs(query_params)
+        result = get_es_service().search_logs(query_params)
         
         if result.get('logs'):
-            return format_elasticsearch_logs(result['logs'])
+            return cache_es_pod_logs(app, cluster, bundle, pod, es_key, result['logs'], timeout)
         
         return None
         
     except Exception as e:
-        logger.error(f"Error getting pod logs from Elasticsearch: {str(e)}")
+        logger.error("Error getting pod logs from Elasticsearch: %s", e)
         return None
 
+def prefetch_pod_logs_for(app: str, cluster: str, bundle: str, pods: List[str]) -> int:
+    """Warm the ES pod log cache for pods with one multi-search; returns pods fetched"""
+    if not pods or not get_es_service().is_available():
+        return 0
+
+    mapped_app, mapped_cluster, mapped_bundle, _ = map_frontend_to_elasticsearch_values(app, cluster, bundle, '')
+    # Mapped pod -> a frontend name for it, which is what hot_pod_cache_key expects
+    mapped_pods = {map_frontend_to_elasticsearch_values(app, cluster, bundle, pod)[3]: pod for pod in pods}
+
+    # Skip pods that are already cached so repeat prefetches cost nothing
+    keys = {pod: es_pod_logs_cache_key(mapped_app, mapped_cluster, mapped_bundle, pod) for pod in mapped_pods}
+    cached = cache.get_many(keys.values())
+    missing = [pod for pod, key in keys.items() if key not in cached]
+    if not missing:
+        return 0
+    logs_by_pod = get_es_service().msearch_pods(
+        mapped_app, mapped_cluster, mapped_bundle, missing,
+        size=POD_LOGS_ES_SIZE, source_fields=POD_LOG_SOURCE_FIELDS
+    )
+
+    # Same entries and hot-pod TTL as get_pod_logs_from_elasticsearch, so later clicks are cache hits
+    fetched = 0
+    for pod, logs in logs_by_pod.items():
+        if logs:
+            cache_es_pod_logs(app, cluster, bundle, mapped_pods[pod], keys[pod], logs)
+            fetched += 1
+    return fetched
+
+def prefetch_pod_logs_in_background(app: str, cluster: str, bundle: str, pods: List[str]):
+    """Start a pod log prefetch on the background executor; errors are only logged"""
+    def run():
+        try:
+            prefetch_pod_logs_for(app, cluster, bundle, pods)
+        except Exception as e:
+            logger.error("❌ Error prefetching pod logs for %s-%s-%s: %s", app, cluster, bundle, e)
+    
+    SAMPLE_SEED_EXECUTOR.submit(run)
+
+@require_POST
+@csrf_exempt
+def prefetch_pod_logs(request):
+    """Warm the pod log cache for every listed pod with one ES multi-search"""
+    try:
+        app = request.POST.get('application', '').strip()
+        cluster = request.POST.get('cluster', '').strip()
+        bundle = request.POST.get('bundle', '').strip()
+
+        if not all([app, cluster, bundle]):
+            return JsonResponse({"error": "Missing required parameters", "prefetched": 0}, status=400)
+
+        # Pods as repeated fields or comma separated; default to the listed pods
+        pods = [p.strip() for value in request.POST.getlist('pods') for p in value.split(',') if p.strip()]
+        if not pods:
+            pods = [pod['name'] for pod in cache.get(build_cache_key('pods', app, cluster, bundle)) or []]
+
+        return JsonResponse({"prefetched": prefetch_pod_logs_for(app, cluster, bundle, pods)})
+
+    except Exception as e:
+        logger.error("Error prefetching pod logs: %s", e)
+        return JsonResponse({"error": f"Failed to prefetch pod logs: {str(e)}", "prefetched": 0}, status=500)
+
+@require_GET
+@csrf_exempt
+def download_pod_logs(request):
+    """Stream a pod's Elasticsearch logs as a plain-text download"""
+    app = request.GET.get('application', '').strip()
+    cluster = request.GET.get('cluster', '').strip()
+    bundle = request.GET.get('bundle', '').strip()
+    pod = request.GET.get('pod', '').strip()
+    
+    # Validate required fields
+    if not all([app, cluster, bundle, pod]):
+        return JsonResponse({"error": "Missing required parameters"}, status=400)
+    
+    try:
+        mapped_app, mapped_cluster, mapped_bundle, mapped_pod = map_frontend_to_elasticsearch_values(
+            app, cluster, bundle, pod
+        )
+        result = get_es_service().search_logs({
+            'application': mapped_app,
+            'cluster': mapped_cluster,
+            'bundle': mapped_bundle,
+            'pod': mapped_pod,
+            'size': POD_LOGS_ES_SIZE,
+            'page': 1,
+            'source_fields': POD_LOG_SOURCE_FIELDS
+        })
+        
+        if not result.get('logs'):
+            return JsonResponse({"error": result.get('error', 'No logs found')}, status=404)
+        
+        # Lines are written to the client as they are formatted, keeping peak memory flat
+        response = StreamingHttpResponse(
+            (f"{line}\n" for line in iter_elasticsearch_log_lines(result['logs'])),
+            content_type='text/plain; charset=utf-8'
+        )
+        response['Content-Disposition'] = f'attachment; filename="{sanitize_filename(pod)}.log"'
+        return response
+        
+    except Exception as e:
+        logger.error(f"Error downloading pod logs: {str(e)}")
+        return JsonResponse({"error": f"Failed to download pod logs: {str(e)}"}, status=500)
+
 def get_pod_logs_from_files(app: str, cluster: str, bundle: str, pod: str) -> tuple:
     """Get pod logs from files (original implementation)"""
     # This is a placeholder - implement as needed
@@ -834,22 +1363,28 @@ def summarize_logs(request):
     use_together = request.POST.get("use_together", "true").lower() == "true"
     
     if not log_text or log_text in ["Waiting for execution...", "Fetching pod logs..."]:
-        return JsonResponse({"summary": "❌ No logs available to summarize."})
+        return orjson_response({"summary": "❌ No logs available to summarize."})
+    
+    # Cheap checks before any hashing, cache lookup or Together.ai call
+    if len(log_text) < MIN_ANALYSIS_LOG_CHARS or not LOG_LEVEL_WORD_RE.search(log_text):
+        return orjson_response({"summary": "❌ Insufficient log content for AI analysis."})
 
     try:
         # Try Together.ai first if API key is available
         if TOGETHER_API_KEY and use_together:
+            # Re-runs on identical log content (refresh, tab switch) are served from the
+            # Together.ai result cache without an API round trip
             together_summary = get_together_ai_summary(log_text)
             if together_summary and not together_summary.startswith("❌"):
-                return JsonResponse({
+                return orjson_response({
                     "summary": together_summary,
                     "ai_service": "together_ai",
-                    "model": "meta-llama/Llama-3-8b-chat-hf"
+                    "model": TOGETHER_MODEL
                 })
         
         # Fallback to local analysis
         local_summary = generate_local_summary(log_text)
-        return JsonResponse({
+        return orjson_response({
             "summary": local_summary,
             "ai_service": "local_ai",
             "model": "LogOps Pattern Analysis Engine"
@@ -857,7 +1392,7 @@ def summarize_logs(request):
         
     except Exception as e:
         logger.error(f"Error in log summarization: {str(e)}")
-        return JsonResponse({"summary": f"❌ Unexpected error: {str(e)}"})
+        return orjson_response({"summary": f"❌ Unexpected error: {str(e)}"})
 
 @csrf_exempt
 def analyze_logs(request):
@@ -866,22 +1401,28 @@ def analyze_logs(request):
     use_together = request.POST.get("use_together", "true").lower() == "true"
     
     if not log_text or log_text in ["Waiting for execution...", "Fetching pod logs..."]:
-        return JsonResponse({"analysis": "❌ No logs available for root cause analysis."})
+        return orjson_response({"analysis": "❌ No logs available for root cause analysis."})
+    
+    # Cheap checks before any hashing, cache lookup or Together.ai call
+    if len(log_text) < MIN_ANALYSIS_LOG_CHARS or not LOG_LEVEL_WORD_RE.search(log_text):
+        return orjson_response({"analysis": "❌ Insufficient log content for AI analysis."})
 
     try:
         # Try Together.ai first if API key is available
         if TOGETHER_API_KEY and use_together:
+            # Re-runs on identical log content (refresh, tab switch) are served from the
+            # Together.ai result cache without an API round trip
             together_analysis = get_together_ai_analysis(log_text)
             if together_analysis and not together_analysis.startswith("❌"):
-                return JsonResponse({
+                return orjson_response({
                     "analysis": together_analysis,
                     "ai_service": "together_ai",
-                    "model": "meta-llama/Llama-3-8b-chat-hf"
+                    "model": TOGETHER_MODEL
                 })
         
         # Fallback to local analysis
         local_analysis = generate_local_rca(log_text)
-        return JsonResponse({
+        return orjson_response({
             "analysis": local_analysis,
             "ai_service": "local_ai",
             "model": "LogOps RCA Engine"
@@ -889,37 +1430,166 @@ def analyze_logs(request):
         
     except Exception as e:
         logger.error(f"Error in log analysis: {str(e)}")
-        return JsonResponse({"analysis": f"❌ Unexpected error: {str(e)}"})
+        return orjson_response({"analysis": f"❌ Unexpected error: {str(e)}"})
 
-def get_together_ai_summary(log_text: str) -> str:
-    """Get summary from Together.ai"""
+def log_text_digest(log_text: str) -> str:
+    """SHA-1 of the log text; identical log content maps to the same cache entries"""
+    return hashlib.sha1(log_text.encode('utf-8')).hexdigest()
+
+def post_together_chat(data: Dict[str, Any]) -> requests.Response:
+    """POST a chat completion to Together.ai over the shared keep-alive session"""
+    return http_session.post(TOGETHER_API_URL, headers=TOGETHER_HEADERS, json=data, timeout=TOGETHER_TIMEOUT)
+
+def truncate_log_for_prompt(log_text: str, budget: int = TOGETHER_PROMPT_CHAR_BUDGET) -> str:
+    """Fit log text into the prompt budget, keeping FATAL/ERROR/WARN lines ahead of the rest"""
+    if len(log_text) <= budget:
+        return log_text
+    
+    lines = log_text.split('\n')
+    
+    def severity(index):
+        match = LINE_SEVERITY_RE.search(lines[index])
+        return LINE_SEVERITY_RANK[match.group()] if match else len(LINE_SEVERITY_RANK)
+    
+    # Greedily take lines by severity (ties in log order), then restore log order
+    kept = []
+    used = 0
+    for index in sorted(range(len(lines)), key=severity):
+        cost = len(lines[index]) + 1
+        if used + cost <= budget:
+            kept.append(index)
+            used += cost
+    kept.sort()
+    
+    parts = []
+    previous = -1
+    for index in kept:
+        if index - previous > 1:
+            parts.append(f"... ({index - previous - 1} lines omitted) ...")
+        parts.append(lines[index])
+        previous = index
+    if len(lines) - previous > 1:
+        parts.append(f"... ({len(lines) - previous - 1} lines omitted) ...")
+    return '\n'.join(parts)
+
+def brand_together_summary(summary: str) -> str:
+    """Add Together.ai branding to a summary"""
+    ai_summary = f"🤖 **Together.ai Analysis** (Llama-3-8b)\n\n{summary.strip()}"
+    ai_summary += f"\n\n📊 **Analysis Metadata:**\n"
+    ai_summary += f"• Model: meta-llama/Llama-3-8b-chat-hf\n"
+    ai_summary += f"• Service: Together.ai Cloud AI\n"
+    ai_summary += f"• Generated: {now_display()}"
+    return ai_summary
+
+def brand_together_analysis(analysis: str) -> str:
+    """Add Together.ai branding to a root cause analysis"""
+    ai_analysis = f"🔬 **Together.ai Root Cause Analysis** (Llama-3-8b)\n\n{analysis.strip()}"
+    ai_analysis += f"\n\n📊 **Analysis Metadata:**\n"
+    ai_analysis += f"• Model: meta-llama/Llama-3-8b-chat-hf\n"
+    ai_analysis += f"• Service: Together.ai Cloud AI\n"
+    ai_analysis += f"• Analysis Method: Large Language Model\n"
+    ai_analysis += f"• Generated: {now_display()}"
+    return ai_analysis
+
+def together_result_cache_key(log_text: str) -> str:
+    """Cache key for the branded Together.ai summary and analysis of one log text"""
+    return f"together_result_{log_text_digest(log_text)}"
+
+def remember_together_result(log_text: str, key: str, branded: str):
+    """Add one branded result ('summary' or 'analysis') to the log text's cached Together.ai results"""
+    cache_key = together_result_cache_key(log_text)
+    results = cache.get(cache_key) or {}
+    results[key] = branded
+    cache.set(cache_key, results, TOGETHER_RESULT_CACHE_TIMEOUT)
+
+def get_together_ai_combined(log_text: str) -> Dict[str, str]:
+    """Get branded summary and root cause analysis from one Together.ai call, cached per log text"""
+    cache_key = together_result_cache_key(log_text)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        # Check for log text length
-        if len(log_text) > 8000:
-            log_text = log_text[:8000] + "\n... (truncated for analysis)"
+        # Keep the most severe lines when the log is over the prompt budget
+        log_text = truncate_log_for_prompt(log_text)
 
-        headers = {
-            "Authorization": f"Bearer {TOGETHER_API_KEY}",
-            "Content-Type": "application/json"
+        data = {
+            "model": TOGETHER_MODEL,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": TOGETHER_COMBINED_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": f"Summarize and perform root cause analysis on this application log:\n\n{log_text}"
+                }
+            ],
+            "response_format": {"type": "json_object"},
+            "max_tokens": 1100,
+            "temperature": 0.3,
+            "top_p": 0.9
         }
         
+        response = post_together_chat(data)
+        
+        if response.status_code != 200:
+            # The model may reject JSON mode; callers fall back to single-purpose requests.
+            # Client errors other than rate limiting repeat on retry, so remember them too
+            logger.warning(f"Together.ai combined request failed: {response.status_code} - {response.text[:200]}")
+            if 400 <= response.status_code < 500 and response.status_code != 429:
+                cache.set(cache_key, {}, TOGETHER_RESULT_CACHE_TIMEOUT)
+            return {}
+        
+        content = orjson.loads(response.content).get("choices", [{}])[0].get("message", {}).get("content", "")
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            parsed = {}
+        
+        # Whatever keys came back are kept, even none (model ignored the JSON format), so
+        # the other endpoint doesn't repeat the combined call and only the missing parts
+        # go through single-purpose requests
+        result = {}
+        if isinstance(parsed.get('summary'), str) and parsed['summary']:
+            result['summary'] = brand_together_summary(parsed['summary'])
+        if isinstance(parsed.get('analysis'), str) and parsed['analysis']:
+            result['analysis'] = brand_together_analysis(parsed['analysis'])
+        cache.set(cache_key, result, TOGETHER_RESULT_CACHE_TIMEOUT)
+        return result
+        
+    except requests.exceptions.Timeout:
+        logger.error("Together.ai request timeout")
+        return {'error': "❌ Together.ai request timeout"}
+    except Exception as e:
+        logger.error(f"Error with Together.ai combined analysis: {str(e)}")
+        return {}
+
+def get_together_ai_summary(log_text: str) -> str:
+    """Get summary from Together.ai"""
+    # One call answers both summary and analysis; the other endpoint then hits the cache
+    combined = get_together_ai_combined(log_text)
+    if combined.get('summary'):
+        return combined['summary']
+    if combined.get('error'):
+        return combined['error']
+    
+    try:
+        # Keep the most severe lines when the log is over the prompt budget
+        prompt_log = truncate_log_for_prompt(log_text)
+
         data = {
-            "model": "meta-llama/Llama-3-8b-chat-hf",
+            "model": TOGETHER_MODEL,
             "messages": [
                 {
                     "role": "system",
-                    "content": """You are an expert DevOps engineer who specializes in analyzing application logs. 
-                    Provide a clear, concise summary that includes:
-                    1. Overall status (Success/Failure/Warning)
-                    2. Key events or operations performed
-                    3. Any errors or warnings found
-                    4. Performance metrics if available
-                    5. Actionable recommendations
-                    Keep the summary under 300 words and use bullet points for clarity."""
+                    "content": TOGETHER_SUMMARY_PROMPT
                 },
                 {
                     "role": "user",
-                    "content": f"Analyze and summarize this application log:\n\n{log_text}"
+                    "content": f"Analyze and summarize this application log:\n\n{prompt_log}"
                 }
             ],
             "max_tokens": 500,
@@ -927,25 +1597,17 @@ def get_together_ai_summary(log_text: str) -> str:
             "top_p": 0.9
         }
         
-        response = requests.post(
-            "https://api.together.xyz/v1/chat/completions", 
-            headers=headers, 
-            json=data,
-            timeout=30
-        )
+        response = post_together_chat(data)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             summary = result.get("choices", [{}])[0].get("message", {}).get("content", "")
             
             if summary:
-                # Add Together.ai branding
-                ai_summary = f"🤖 **Together.ai Analysis** (Llama-3-8b)\n\n{summary.strip()}"
-                ai_summary += f"\n\n📊 **Analysis Metadata:**\n"
-                ai_summary += f"• Model: meta-llama/Llama-3-8b-chat-hf\n"
-                ai_summary += f"• Service: Together.ai Cloud AI\n"
-                ai_summary += f"• Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                return ai_summary
+                # Cached with the combined results, so re-runs on the same log skip the API
+                summary = brand_together_summary(summary)
+                remember_together_result(log_text, 'summary', summary)
+                return summary
             else:
                 return "❌ Received empty response from Together.ai"
         else:
@@ -961,36 +1623,26 @@ def get_together_ai_summary(log_text: str) -> str:
 
 def get_together_ai_analysis(log_text: str) -> str:
     """Get root cause analysis from Together.ai"""
+    combined = get_together_ai_combined(log_text)
+    if combined.get('analysis'):
+        return combined['analysis']
+    if combined.get('error'):
+        return combined['error']
+    
     try:
-        # Check for log text length
-        if len(log_text) > 8000:
-            log_text = log_text[:8000] + "\n... (truncated for analysis)"
+        # Keep the most severe lines when the log is over the prompt budget
+        prompt_log = truncate_log_for_prompt(log_text)
 
-        headers = {
-            "Authorization": f"Bearer {TOGETHER_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
         data = {
-            "model": "meta-llama/Llama-3-8b-chat-hf",
+            "model": TOGETHER_MODEL,
             "messages": [
                 {
                     "role": "system",
-                    "content": """You are a senior DevOps engineer specializing in root cause analysis. 
-                    Analyze the provided logs and identify:
-                    1. Primary errors or failures and their root causes
-                    2. Impact assessment (High/Medium/Low)
-                    3. Recommended actions to resolve issues
-                    4. Prevention strategies for the future
-                    5. Timeline of critical events
-                    
-                    Be specific and actionable in your recommendations. 
-                    If no errors are found, indicate successful execution and any optimization opportunities.
-                    Provide step-by-step remediation where applicable."""
+                    "content": TOGETHER_RCA_PROMPT
                 },
                 {
                     "role": "user",
-                    "content": f"Perform comprehensive root cause analysis on this log:\n\n{log_text}"
+                    "content": f"Perform comprehensive root cause analysis on this log:\n\n{prompt_log}"
                 }
             ],
             "max_tokens": 600,
@@ -998,26 +1650,17 @@ def get_together_ai_analysis(log_text: str) -> str:
             "top_p": 0.9
         }
         
-        response = requests.post(
-            "https://api.together.xyz/v1/chat/completions", 
-            headers=headers, 
-            json=data,
-            timeout=30
-        )
+        response = post_together_chat(data)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             analysis = result.get("choices", [{}])[0].get("message", {}).get("content", "")
             
             if analysis:
-                # Add Together.ai branding
-                ai_analysis = f"🔬 **Together.ai Root Cause Analysis** (Llama-3-8b)\n\n{analysis.strip()}"
-                ai_analysis += f"\n\n📊 **Analysis Metadata:**\n"
-                ai_analysis += f"• Model: meta-llama/Llama-3-8b-chat-hf\n"
-                ai_analysis += f"• Service: Together.ai Cloud AI\n"
-                ai_analysis += f"• Analysis Method: Large Language Model\n"
-                ai_analysis += f"• Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                return ai_analysis
+                # Cached with the combined results, so re-runs on the same log skip the API
+                analysis = brand_together_analysis(analysis)
+                remember_together_result(log_text, 'analysis', analysis)
+                return analysis
             else:
                 return "❌ Received empty response from Together.ai"
         else:
@@ -1031,45 +1674,61 @@ def get_together_ai_analysis(log_text: str) -> str:
         logger.error(f"Error with Together.ai analysis: {str(e)}")
         return f"❌ Together.ai error: {str(e)}"
 
+def scan_log_levels(log_text: str, keep: int = 0):
+    """Count lines containing each log level, keeping the first `keep` ERROR and WARN lines"""
+    # findall keeps each count in C; no match object per line
+    lines_by_level = {level: line_re.findall(log_text) for level, line_re in LOG_LEVEL_LINE_RES.items()}
+    counts = Counter({level: len(lines) for level, lines in lines_by_level.items()})
+    shown = {level: lines_by_level[level][:keep] for level in ('ERROR', 'WARN')}
+    return counts, shown
+
+def find_rca_keywords(log_text: str) -> set:
+    """Which RCA_KEYWORDS occur in the text, found in a single scan without lowercasing it"""
+    found = set()
+    for match in RCA_KEYWORD_RE.finditer(log_text):
+        found.add(match.group().lower())
+        if len(found) == len(RCA_KEYWORDS):
+            break
+    return found
+
 def generate_local_summary(log_text: str) -> str:
     """Generate local summary when Together.ai is not available"""
     try:
-        lines = log_text.split('\n')
-        
         # Count log levels
-        info_count = len([line for line in lines if 'INFO' in line])
-        warn_count = len([line for line in lines if 'WARN' in line])
-        error_count = len([line for line in lines if 'ERROR' in line])
+        level_counts, _ = scan_log_levels(log_text)
+        info_count = level_counts['INFO']
+        warn_count = level_counts['WARN']
+        error_count = level_counts['ERROR']
         
         # Analyze patterns
-        summary = f"📊 **Local Log Analysis Engine**\n\n"
-        summary += f"**Log Summary:**\n"
-        summary += f"• Total log entries: {len([line for line in lines if line.strip()])}\n"
-        summary += f"• INFO messages: {info_count}\n"
-        summary += f"• WARN messages: {warn_count}\n"
-        summary += f"• ERROR messages: {error_count}\n\n"
+        parts = [f"📊 **Local Log Analysis Engine**\n\n"]
+        parts.append(f"**Log Summary:**\n")
+        parts.append(f"• Total log entries: {len(NONBLANK_LINE_RE.findall(log_text))}\n")
+        parts.append(f"• INFO messages: {info_count}\n")
+        parts.append(f"• WARN messages: {warn_count}\n")
+        parts.append(f"• ERROR messages: {error_count}\n\n")
         
         if error_count > 0:
-            summary += f"**Status: ⚠️ ERRORS DETECTED**\n"
-            summary += f"• {error_count} error(s) found requiring attention\n"
+            parts.append(f"**Status: ⚠️ ERRORS DETECTED**\n")
+            parts.append(f"• {error_count} error(s) found requiring attention\n")
         elif warn_count > 0:
-            summary += f"**Status: ⚡ WARNINGS PRESENT**\n"
-            summary += f"• {warn_count} warning(s) detected\n"
+            parts.append(f"**Status: ⚡ WARNINGS PRESENT**\n")
+            parts.append(f"• {warn_count} warning(s) detected\n")
         else:
-            summary += f"**Status: ✅ HEALTHY**\n"
-            summary += f"• No errors or warnings detected\n"
+            parts.append(f"**Status: ✅ HEALTHY**\n")
+            parts.append(f"• No errors or warnings detected\n")
         
-        summary += f"\n**Recommendations:**\n"
+        parts.append(f"\n**Recommendations:**\n")
         if error_count > 0:
-            summary += f"• Immediate investigation required for errors\n"
+            parts.append(f"• Immediate investigation required for errors\n")
         if warn_count > 0:
-            summary += f"• Monitor warnings for potential issues\n"
-        summary += f"• Continue monitoring system health\n"
+            parts.append(f"• Monitor warnings for potential issues\n")
+        parts.append(f"• Continue monitoring system health\n")
         
-        summary += f"\n📈 **Analysis Engine:** LogOps Pattern Analyzer\n"
-        summary += f"🕒 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        parts.append(f"\n📈 **Analysis Engine:** LogOps Pattern Analyzer\n")
+        parts.append(f"🕒 **Generated:** {now_display()}")
         
-        return summary
+        return "".join(parts)
         
     except Exception as e:
         return f"❌ Error generating local summary: {str(e)}"
@@ -1077,61 +1736,61 @@ def generate_local_summary(log_text: str) -> str:
 def generate_local_rca(log_text: str) -> str:
     """Generate local root cause analysis when Together.ai is not available"""
     try:
-        lines = log_text.split('\n')
-        
-        # Find errors and warnings
-        errors = [line for line in lines if 'ERROR' in line]
-        warnings = [line for line in lines if 'WARN' in line]
-        
-        analysis = f"🔍 **Local Root Cause Analysis Engine**\n\n"
-        
-        if errors:
-            analysis += f"**🚨 Critical Issues Found ({len(errors)}):**\n"
-            for i, error in enumerate(errors[:3], 1):  # Show first 3 errors
-                analysis += f"{i}. {error.strip()}\n"
-            if len(errors) > 3:
-                analysis += f"... and {len(errors) - 3} more errors\n"
-            analysis += f"\n"
+        # Find errors and warnings, keeping only the lines that are shown
+        level_counts, shown = scan_log_levels(log_text, keep=3)
+        error_count = level_counts['ERROR']
+        warning_count = level_counts['WARN']
+        
+        parts = [f"🔍 **Local Root Cause Analysis Engine**\n\n"]
+        
+        if error_count:
+            parts.append(f"**🚨 Critical Issues Found ({error_count}):**\n")
+            for i, error in enumerate(shown['ERROR'], 1):  # Show first 3 errors
+                parts.append(f"{i}. {error.strip()}\n")
+            if error_count > 3:
+                parts.append(f"... and {error_count - 3} more errors\n")
+            parts.append(f"\n")
             
-            analysis += f"**Root Cause Assessment:**\n"
-            if "timeout" in log_text.lower():
-                analysis += f"• Connection timeouts detected - network or database issues\n"
-            if "memory" in log_text.lower():
-                analysis += f"• Memory-related issues detected - potential resource constraints\n"
-            if "connection" in log_text.lower():
-                analysis += f"• Connection issues detected - service availability problems\n"
+            parts.append(f"**Root Cause Assessment:**\n")
+            keywords = find_rca_keywords(log_text)
+            if "timeout" in keywords:
+                parts.append(f"• Connection timeouts detected - network or database issues\n")
+            if "memory" in keywords:
+                parts.append(f"• Memory-related issues detected - potential resource constraints\n")
+            if "connection" in keywords:
+                parts.append(f"• Connection issues detected - service availability problems\n")
             
-            analysis += f"\n**Immediate Actions:**\n"
-            analysis += f"1. Check service health and connectivity\n"
-            analysis += f"2. Review system resources (CPU, memory, disk)\n"
-            analysis += f"3. Verify database and network connectivity\n"
-            analysis += f"4. Check for recent deployments or configuration changes\n"
-        
-        elif warnings:
-            analysis += f"**⚠️ Warning Conditions ({len(warnings)}):**\n"
-            for i, warning in enumerate(warnings[:3], 1):
-                analysis += f"{i}. {warning.strip()}\n"
-            if len(warnings) > 3:
-                analysis += f"... and {len(warnings) - 3} more warnings\n"
+            parts.append(f"\n**Immediate Actions:**\n")
+            parts.append(f"1. Check service health and connectivity\n")
+            parts.append(f"2. Review system resources (CPU, memory, disk)\n")
+            parts.append(f"3. Verify database and network connectivity\n")
+            parts.append(f"4. Check for recent deployments or configuration changes\n")
+        
+        elif warning_count:
+            parts.append(f"**⚠️ Warning Conditions ({warning_count}):**\n")
+            for i, warning in enumerate(shown['WARN'], 1):
+                parts.append(f"{i}. {warning.strip()}\n")
+            if warning_count > 3:
+                parts.append(f"... and {warning_count - 3} more warnings\n")
             
-            analysis += f"\n**Preventive Actions:**\n"
-            analysis += f"1. Monitor system metrics closely\n"
-            analysis += f"2. Consider scaling resources if needed\n"
-            analysis += f"3. Review performance thresholds\n"
+            parts.append(f"\n**Preventive Actions:**\n")
+            parts.append(f"1. Monitor system metrics closely\n")
+            parts.append(f"2. Consider scaling resources if needed\n")
+            parts.append(f"3. Review performance thresholds\n")
         
         else:
-            analysis += f"**✅ System Operating Normally**\n"
-            analysis += f"• No critical errors detected\n"
-            analysis += f"• System appears healthy\n"
-            analysis += f"\n**Optimization Opportunities:**\n"
-            analysis += f"1. Continue monitoring for trends\n"
-            analysis += f"2. Review performance metrics\n"
-            analysis += f"3. Consider proactive maintenance\n"
+            parts.append(f"**✅ System Operating Normally**\n")
+            parts.append(f"• No critical errors detected\n")
+            parts.append(f"• System appears healthy\n")
+            parts.append(f"\n**Optimization Opportunities:**\n")
+            parts.append(f"1. Continue monitoring for trends\n")
+            parts.append(f"2. Review performance metrics\n")
+            parts.append(f"3. Consider proactive maintenance\n")
         
-        analysis += f"\n🔧 **Analysis Method:** Pattern Recognition & Keyword Analysis\n"
-        analysis += f"🕒 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        parts.append(f"\n🔧 **Analysis Method:** Pattern Recognition & Keyword Analysis\n")
+        parts.append(f"🕒 **Generated:** {now_display()}")
         
-        return analysis
+        return "".join(parts)
         
     except Exception as e:
         return f"❌ Error generating local RCA: {str(e)}"
@@ -1160,7 +1819,7 @@ def test_together_ai(request):
 def elasticsearch_health(request):
     """Get Elasticsearch health status"""
     try:
-        health = elasticsearch_service.get_health_status()
+        health = get_es_service().get_health_status()
         return JsonResponse(health)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
@@ -1171,13 +1830,13 @@ def system_overview(request):
     """Get comprehensive system overview"""
     try:
         overview = {
-            'elasticsearch': elasticsearch_service.get_health_status(),
+            'elasticsearch': get_es_service().get_health_status(),
             'timestamp': datetime.now().isoformat()
         }
         
-        # Get log statistics
+        # Log statistics and the latest logs share one _msearch round trip
         if overview['elasticsearch']['status'] != 'error':
-            overview['log_stats'] = elasticsearch_service.get_log_statistics()
+            overview.update(get_es_service().dashboard_snapshot())
         
         return JsonResponse(overview)
         
@@ -1187,7 +1846,7 @@ def system_overview(request):
     
 def test_elasticsearch_connection(request):
     try:
-        es = elasticsearch_service.get_elasticsearch_client()
+        es = get_es_service().get_elasticsearch_client()
         info = es.info()
         return JsonResponse({"status": "success", "cluster_name": info['cluster_name']})
     except Exception as e:
@@ -1215,64 +1874,52 @@ def generate_sample_pods(app, bundle):
 
 def auto_generate_pod_logs(app, cluster, bundle, pod):
     """Auto-generate realistic pod logs"""
-    base_time = datetime.now() - timedelta(hours=1, minutes=30)
-    logs = []
+    # Whole seconds, so isoformat gives the same layout as '%Y-%m-%d %H:%M:%S', faster
+    base_time = datetime.now().replace(microsecond=0) - timedelta(hours=1, minutes=30)
     
-    # Add startup sequence
-    logs.append(f"[{base_time.strftime('%Y-%m-%d %H:%M:%S')}] INFO: Starting pod {pod}")
-    logs.append(f"[{(base_time + timedelta(seconds=1)).strftime('%Y-%m-%d %H:%M:%S')}] INFO: Application: {app}")
-    logs.append(f"[{(base_time + timedelta(seconds=2)).strftime('%Y-%m-%d %H:%M:%S')}] INFO: Cluster: {cluster}")
-    logs.append(f"[{(base_time + timedelta(seconds=3)).strftime('%Y-%m-%d %H:%M:%S')}] INFO: Bundle: {bundle}")
+    def ts(seconds: int) -> str:
+        return (base_time + timedelta(seconds=seconds)).isoformat(sep=' ', timespec='seconds')
     
-    # Add service-specific logs based on pod name
-    current_time = base_time + timedelta(seconds=20)
+    # Add startup sequence
+    ts0, ts1, ts2, ts3 = (ts(s) for s in (0, 1, 2, 3))
+    logs = [
+        f"[{ts0}] INFO: Starting pod {pod}",
+        f"[{ts1}] INFO: Application: {app}",
+        f"[{ts2}] INFO: Cluster: {cluster}",
+        f"[{ts3}] INFO: Bundle: {bundle}",
+    ]
     
-    if "error" in pod.lower():
+    # Add service-specific logs based on pod name, starting 20s after startup
+    pod_lower = pod.lower()
+    if "error" in pod_lower:
         logs.extend([
-            f"[{current_time.strftime('%Y-%m-%d %H:%M:%S')}] INFO: Processing incoming requests...",
-            f"[{(current_time + timedelta(seconds=30)).strftime('%Y-%m-%d %H:%M:%S')}] WARN: High memory usage detected: 85%",
-            f"[{(current_time + timedelta(seconds=60)).strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Database connection timeout after 30s",
-            f"[{(current_time + timedelta(seconds=90)).strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Failed to process request: connection refused",
-            f"[{(current_time + timedelta(seconds=120)).strftime('%Y-%m-%d %H:%M:%S')}] FATAL: Critical error - service unavailable"
+            f"[{ts(20)}] INFO: Processing incoming requests...",
+            f"[{ts(50)}] WARN: High memory usage detected: 85%",
+            f"[{ts(80)}] ERROR: Database connection timeout after 30s",
+            f"[{ts(110)}] ERROR: Failed to process request: connection refused",
+            f"[{ts(140)}] FATAL: Critical error - service unavailable"
         ])
-    elif "warn" in pod.lower():
+    elif "warn" in pod_lower:
         logs.extend([
-            f"[{current_time.strftime('%Y-%m-%d %H:%M:%S')}] INFO: Service operational - processing requests",
-            f"[{(current_time + timedelta(seconds=45)).strftime('%Y-%m-%d %H:%M:%S')}] WARN: High CPU usage detected: 78%",
-            f"[{(current_time + timedelta(seconds=90)).strftime('%Y-%m-%d %H:%M:%S')}] WARN: Response time degradation: 2.8s (SLA: 1s)",
-            f"[{(current_time + timedelta(seconds=135)).strftime('%Y-%m-%d %H:%M:%S')}] WARN: Queue backlog growing: 150 pending items"
+            f"[{ts(20)}] INFO: Service operational - processing requests",
+            f"[{ts(65)}] WARN: High CPU usage detected: 78%",
+            f"[{ts(110)}] WARN: Response time degradation: 2.8s (SLA: 1s)",
+            f"[{ts(155)}] WARN: Queue backlog growing: 150 pending items"
         ])
     else:
         logs.extend([
-            f"[{current_time.strftime('%Y-%m-%d %H:%M:%S')}] INFO: Service running normally",
-            f"[{(current_time + timedelta(seconds=60)).strftime('%Y-%m-%d %H:%M:%S')}] INFO: Processed 250 requests in last minute",
-            f"[{(current_time + timedelta(seconds=120)).strftime('%Y-%m-%d %H:%M:%S')}] INFO: Health check passed - all systems green",
-            f"[{(current_time + timedelta(seconds=180)).strftime('%Y-%m-%d %H:%M:%S')}] INFO: Database queries avg response: 45ms"
+            f"[{ts(20)}] INFO: Service running normally",
+            f"[{ts(80)}] INFO: Processed 250 requests in last minute",
+            f"[{ts(140)}] INFO: Health check passed - all systems green",
+            f"[{ts(200)}] INFO: Database queries avg response: 45ms"
         ])
     
     return "\n".join(logs)
 
 # Preserved Legacy Functions
-@require_POST
-@csrf_exempt
-def send_rca_email(request):
-    """Send RCA analysis via email"""
-    try:
-        email = request.POST.get('email', '').strip()
-        analysis = request.POST.get('analysis', '').strip()
-        pod_name = request.POST.get('pod_name', 'Unknown Pod').strip()
-        
-        if not email:
-            return JsonResponse({'success': False, 'error': 'Email address required'})
-        
-        if not analysis:
-            return JsonResponse({'success': False, 'error': 'No analysis to send'})
-        
-        # Email subject and content
-        subject = f"🔬 LogOps RCA Report - {pod_name}"
-        
-        # Create HTML email content
-        html_content = f"""
+
+# RCA email bodies as format_map templates; values going into the HTML are escaped first
+RCA_EMAIL_HTML_TEMPLATE = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -1303,7 +1950,7 @@ def send_rca_email(request):
                             </tr>
                             <tr>
                                 <td style="padding: 5px 0; font-weight: 600; color: #6b7280;">Generated:</td>
-                                <td style="padding: 5px 0; color: #111827;">{datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}</td>
+                                <td style="padding: 5px 0; color: #111827;">{generated}</td>
                             </tr>
                             <tr>
                                 <td style="padding: 5px 0; font-weight: 600; color: #6b7280;">Sent to:</td>
@@ -1336,14 +1983,13 @@ def send_rca_email(request):
         </body>
         </html>
         """
-        
-        # Plain text version for email clients that don't support HTML
-        text_content = f"""
+
+RCA_EMAIL_TEXT_TEMPLATE = """
 LogOps Root Cause Analysis Report
 ================================
 
 Pod: {pod_name}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+Generated: {generated}
 Sent to: {email}
 
 ROOT CAUSE ANALYSIS RESULTS:
@@ -1353,6 +1999,36 @@ ROOT CAUSE ANALYSIS RESULTS:
 This report was generated by LogOps - Enhanced Log Analysis Platform
 Powered by Elasticsearch Cloud & Together.ai
         """
+
+@require_POST
+@csrf_exempt
+def send_rca_email(request):
+    """Send RCA analysis via email"""
+    try:
+        email = request.POST.get('email', '').strip()
+        analysis = request.POST.get('analysis', '').strip()
+        pod_name = request.POST.get('pod_name', 'Unknown Pod').strip()
+        
+        if not email:
+            return JsonResponse({'success': False, 'error': 'Email address required'})
+        
+        if not analysis:
+            return JsonResponse({'success': False, 'error': 'No analysis to send'})
+        
+        # Email subject and content
+        subject = f"🔬 LogOps RCA Report - {pod_name}"
+        
+        # Fill both bodies with str.format_map; only the four values change per email
+        values = {
+            'pod_name': pod_name,
+            'email': email,
+            'analysis': analysis,
+            'generated': f"{now_display()} UTC",
+        }
+        html_content = RCA_EMAIL_HTML_TEMPLATE.format_map({key: escape(value) for key, value in values.items()})
+        
+        # Plain text version for email clients that don't support HTML
+        text_content = RCA_EMAIL_TEXT_TEMPLATE.format_map(values)
         
         # Send email using Django's EmailMultiAlternatives
         try:
@@ -1,133 +1,270 @@
-import requests
-import json
+import gzip
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-import random
+import numpy as np
+import orjson
+from elasticsearch import Elasticsearch
+from elasticsearch.helpers import parallel_bulk
+
+from services.http_client import http_session
+from services.log_mapping import KEYWORD_ONLY
 
 # Elasticsearch connection
 es_url = 'http://localhost:9200'
 
-try:
-    # Test connection
-    response = requests.get(f'{es_url}/_cluster/health')
-    if response.status_code != 200:
-        print('Error: Cannot connect to Elasticsearch')
-        exit(1)
-    
-    print('Connected to Elasticsearch successfully!')
-    
-    # Create sample log data
-    applications = ['FOBPM', 'BOBPM', 'BRMS']
-    clusters = ['cluster1', 'cluster2', 'cluster3', 'cluster4'] 
-    bundles = ['Bulkdeviceenrollment', 'Bulkordervalidation', 'IOTSubscription']
-    log_levels = ['INFO', 'WARN', 'ERROR', 'DEBUG']
+# Bulk load tuning: docs per _bulk request, and a byte cap that flushes a chunk early
+BULK_BATCH_SIZE = 500
+MAX_CHUNK_BYTES = 10 * 1024 * 1024
+BULK_THREAD_COUNT = 8
+
+# Index settings while loading: no periodic refreshes, no replica copies to write,
+# and fewer translog flushes
+BULK_LOAD_SETTINGS = {'refresh_interval': '-1', 'number_of_replicas': 0, 'translog.flush_threshold_size': '1gb'}
+
+INDEX_MAPPINGS = {
+    'properties': {
+        '@timestamp': {'type': 'date'},
+        'application': KEYWORD_ONLY,
+        'cluster': KEYWORD_ONLY,
+        'bundle': KEYWORD_ONLY,
+        'pod': KEYWORD_ONLY,
+        'log_level': KEYWORD_ONLY,
+        'source_file': {'type': 'keyword'},
+        'log_message': {'type': 'text'}
+    }
+}
+
+
+# Sample log vocabulary
+applications = ['FOBPM', 'BOBPM', 'BRMS']
+clusters = ['cluster1', 'cluster2', 'cluster3', 'cluster4'] 
+bundles = ['Bulkdeviceenrollment', 'Bulkordervalidation', 'IOTSubscription']
+log_levels = ['INFO', 'WARN', 'ERROR', 'DEBUG']
+# Realistic mix: 10% errors, 20% of the rest warnings, remainder info/debug evenly
+level_weights = [36, 18, 10, 36]
+
+messages = {
+    'INFO': [
+        'Service started successfully',
+        'Processing request completed', 
+        'Health check passed',
+        'Database connection established',
+        'User authentication successful'
+    ],
+    'WARN': [
+        'High memory usage detected: 85%',
+        'Response time degradation: 2.8s',
+        'Queue backlog growing: 150 pending items',
+        'Connection pool exhausted',
+        'Cache miss ratio high: 65%'
+    ],
+    'ERROR': [
+        'Database connection timeout after 30s',
+        'Failed to process request: connection refused',
+        'Authentication failed: invalid credentials', 
+        'OutOfMemoryError: Java heap space',
+        'Network timeout: connection reset by peer'
+    ],
+    'DEBUG': [
+        'Method execution started',
+        'Variable state: processing=true',
+        'Cache lookup performed',
+        'Request parameters validated',
+        'Session data retrieved'
+    ]
+}
+status_codes = [200, 201, 400, 401, 404, 500, 503]
+pod_roles = ['web', 'api', 'worker']
+# Every pod name an application/bundle pair can produce, rendered once up front
+pod_names = {
+    (app, bundle): [f'{app.lower()}-{bundle.lower()}-{role}-{n:03d}' for role in pod_roles for n in range(1, 4)]
+    for app in applications
+    for bundle in bundles
+}
+
+
+def generate_sample_logs(log_count, base_time, seed=None):
+    """Random sample log documents spread over the 24 hours after base_time"""
+    # Draw every random column as one numpy array; the loop below only assembles records
+    rng = np.random.default_rng(seed)
+    app_idx = rng.integers(0, len(applications), log_count)
+    cluster_idx = rng.integers(0, len(clusters), log_count)
+    bundle_idx = rng.integers(0, len(bundles), log_count)
+    level_idx = rng.choice(len(log_levels), log_count, p=np.array(level_weights) / sum(level_weights))
+    msg_idx = rng.integers(0, 5, log_count)
+    pod_idx = rng.integers(0, len(pod_roles) * 3, log_count)
+    has_metrics = (rng.random(log_count) < 0.3).tolist()  # 30% have metrics
+    response_times = rng.uniform(0.1, 5.0, log_count).round(2).tolist()
+    has_status = (rng.random(log_count) < 0.2).tolist()  # 20% have status codes
+    status_picks = rng.choice(status_codes, log_count).tolist()
+    # ISO timestamps for all logs in one vectorized pass, second resolution
+    offsets = rng.integers(0, 24 * 3600, log_count).astype('timedelta64[s]')
+    timestamps = np.datetime_as_string(np.datetime64(base_time, 's') + offsets, unit='s').tolist()
     
     sample_logs = []
-    base_time = datetime.now() - timedelta(hours=24)
-    
-    for i in range(1000):  # Create 1000 sample logs
-        app = random.choice(applications)
-        cluster = random.choice(clusters)
-        bundle = random.choice(bundles)
-        level = random.choice(log_levels)
+    for i, (a, c, b, lv, m, p) in enumerate(zip(app_idx.tolist(), cluster_idx.tolist(), bundle_idx.tolist(),
+                                                 level_idx.tolist(), msg_idx.tolist(), pod_idx.tolist())):
+        app = applications[a]
+        bundle = bundles[b]
+        level = log_levels[lv]
+        message = messages[level][m]
         
-        # Weight log levels realistically
-        if random.random() < 0.1:  # 10% errors
-            level = 'ERROR'
-        elif random.random() < 0.2:  # 20% warnings  
-            level = 'WARN'
-        else:  # 70% info/debug
-            level = random.choice(['INFO', 'DEBUG'])
+        # Add performance metrics and status codes for some logs
+        if has_metrics[i]:
+            message += f' [response_time: {response_times[i]}s]'
+        if has_status[i]:
+            message += f' [status: {status_picks[i]}]'
         
-        log_time = base_time + timedelta(
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59),
-            seconds=random.randint(0, 59)
-        )
-        
-        messages = {
-            'INFO': [
-                'Service started successfully',
-                'Processing request completed', 
-                'Health check passed',
-                'Database connection established',
-                'User authentication successful'
-            ],
-            'WARN': [
-                'High memory usage detected: 85%',
-                'Response time degradation: 2.8s',
-                'Queue backlog growing: 150 pending items',
-                'Connection pool exhausted',
-                'Cache miss ratio high: 65%'
-            ],
-            'ERROR': [
-                'Database connection timeout after 30s',
-                'Failed to process request: connection refused',
-                'Authentication failed: invalid credentials', 
-                'OutOfMemoryError: Java heap space',
-                'Network timeout: connection reset by peer'
-            ],
-            'DEBUG': [
-                'Method execution started',
-                'Variable state: processing=true',
-                'Cache lookup performed',
-                'Request parameters validated',
-                'Session data retrieved'
-            ]
-        }
-        
-        message = random.choice(messages[level])
-        
-        # Add performance metrics for some logs
-        if random.random() < 0.3:  # 30% have metrics
-            response_time = round(random.uniform(0.1, 5.0), 2)
-            message += f' [response_time: {response_time}s]'
-        
-        if random.random() < 0.2:  # 20% have status codes
-            status_code = random.choice([200, 201, 400, 401, 404, 500, 503])
-            message += f' [status: {status_code}]'
-        
-        log_entry = {
-            '@timestamp': log_time.isoformat(),
+        sample_logs.append({
+            '@timestamp': timestamps[i],
             'application': app,
-            'cluster': cluster,
+            'cluster': clusters[c],
             'bundle': bundle,
-            'pod': f'{app.lower()}-{bundle.lower()}-{random.choice(["web", "api", "worker"])}-{random.randint(1,3):03d}',
+            'pod': pod_names[app, bundle][p],
             'log_level': level,
             'log_message': message,
             'source_file': 'sample_data'
-        }
-        
-        sample_logs.append(log_entry)
+        })
     
-    # Bulk index the logs
-    today = datetime.now().strftime('%Y.%m.%d')
-    index_name = f'logops-logs-{today}'
-    
-    bulk_data = []
-    for log in sample_logs:
-        # Add index action
-        bulk_data.append(json.dumps({'index': {'_index': index_name}}))
-        # Add document
-        bulk_data.append(json.dumps(log))
-    
-    bulk_body = '\n'.join(bulk_data) + '\n'
+    return sample_logs
+
+
+def bulk_load_via_file(logs, index_name):
+    """Write the logs as gzipped NDJSON to a temp file and stream it to _bulk.
+
+    The request body is read from disk as it is sent, so memory stays flat however
+    many logs there are; keep each file under the cluster's http.max_content_length.
+    """
+    action_line = orjson.dumps({'index': {'_index': index_name}}) + b'\n'
+    with tempfile.NamedTemporaryFile(suffix='.ndjson.gz', delete=False) as tmp:
+        path = tmp.name
+    try:
+        with gzip.open(path, 'wb', compresslevel=1) as f:
+            for log in logs:
+                f.write(action_line)
+                f.write(orjson.dumps(log))
+                f.write(b'\n')
+        with open(path, 'rb') as f:
+            response = http_session.post(
+                f'{es_url}/_bulk',
+                data=f,
+                headers={'Content-Type': 'application/x-ndjson', 'Content-Encoding': 'gzip'},
+                timeout=300
+            )
+    finally:
+        os.remove(path)
     
-    # Send bulk request
-    headers = {'Content-Type': 'application/x-ndjson'}
-    response = requests.post(f'{es_url}/_bulk', data=bulk_body, headers=headers)
+    if response.status_code != 200:
+        print('Error indexing data:', response.text)
+        return 0, len(logs)
+    result = response.json()
+    failed = sum(1 for item in result['items'] if item['index']['status'] >= 300) if result.get('errors') else 0
+    return len(result['items']) - failed, failed
+
+
+def new_client():
+    """Client for the loader; gzip request bodies since repetitive log JSON compresses several-fold"""
+    return Elasticsearch(es_url, http_compress=True, request_timeout=60, max_retries=3, retry_on_timeout=True)
+
+
+def bulk_load(es, logs, index_name):
+    """Index logs with parallel_bulk; returns (indexed, errors)"""
+    def gen():
+        # Pre-serialized bytes go into the NDJSON body as-is; the index comes from the URL
+        for log in logs:
+            yield orjson.dumps(log)
     
-    if response.status_code == 200:
-        result = response.json()
-        indexed = len([item for item in result['items'] if 'index' in item and item['index']['status'] in [200, 201]])
+    indexed = 0
+    errors = 0
+    # Chunks close at BULK_BATCH_SIZE docs or MAX_CHUNK_BYTES, whichever comes first
+    for ok, item in parallel_bulk(es, gen(), thread_count=BULK_THREAD_COUNT, chunk_size=BULK_BATCH_SIZE,
+                                  max_chunk_bytes=MAX_CHUNK_BYTES, queue_size=4,
+                                  raise_on_error=False, index=index_name):
+        if ok:
+            indexed += 1
+        else:
+            errors += 1
+            if errors <= 5:
+                print('Error indexing document:', item)
+    return indexed, errors
+
+
+def load_slice(index_name, log_count, base_time, seed, via_file=False):
+    """Generate and index one slice of the sample logs; runs in its own process with its own client"""
+    logs = generate_sample_logs(log_count, base_time, seed)
+    if via_file:
+        return bulk_load_via_file(logs, index_name)
+    return bulk_load(new_client(), logs, index_name)
+
+
+def main():
+    try:
+        # Test connection
+        response = http_session.get(f'{es_url}/_cluster/health')
+        if response.status_code != 200:
+            print('Error: Cannot connect to Elasticsearch')
+            exit(1)
+        
+        print('Connected to Elasticsearch successfully!')
+        
+        log_count = 1000  # Create 1000 sample logs
+        base_time = datetime.now() - timedelta(hours=24)
+        via_file = '--via-file' in sys.argv  # For loads too big to hold comfortably in memory
+        processes = int(sys.argv[sys.argv.index('--processes') + 1]) if '--processes' in sys.argv else 1
+        
+        # Bulk index the logs
+        today = datetime.now().strftime('%Y.%m.%d')
+        index_name = f'logops-logs-{today}'
+        
+        es = new_client()
+        
+        # A new index gets an explicit mapping (an existing index keeps its mapping); its other
+        # settings come from the logops template, so they are read back rather than assumed
+        if not es.indices.exists(index=index_name):
+            es.indices.create(index=index_name,
+                              settings={'index': {'codec': 'best_compression'}},
+                              mappings=INDEX_MAPPINGS)
+        
+        # Remember the settings the load overrides, then switch to the load settings
+        current = es.indices.get_settings(index=index_name, flat_settings=True)[index_name]['settings']
+        restore_settings = {key: current.get(f'index.{key}') for key in BULK_LOAD_SETTINGS}
+        es.indices.put_settings(index=index_name, settings={'index': BULK_LOAD_SETTINGS})
+        
+        try:
+            if processes > 1:
+                # Independent slices, each generated and indexed in its own process with its own RNG stream
+                counts = [log_count // processes + (1 if i < log_count % processes else 0) for i in range(processes)]
+                seeds = np.random.SeedSequence().spawn(processes)
+                with ProcessPoolExecutor(max_workers=processes) as executor:
+                    results = list(executor.map(load_slice, [index_name] * processes, counts,
+                                                [base_time] * processes, seeds, [via_file] * processes))
+                indexed = sum(r[0] for r in results)
+                errors = sum(r[1] for r in results)
+            else:
+                indexed, errors = load_slice(index_name, log_count, base_time, None, via_file)
+        finally:
+            # Back to the index's own settings (None resets an unset one to the default), even if the load failed
+            es.indices.put_settings(index=index_name, settings={'index': restore_settings})
+        
         print(f'Successfully indexed {indexed} sample logs into {index_name}')
+        if errors:
+            print(f'{errors} documents failed to index')
         
         # Verify the data
-        search_response = requests.get(f'{es_url}/{index_name}/_search?size=0')
+        es.indices.refresh(index=index_name)
+        # The sample index is written once, so merge it down to a single segment for searching
+        es.indices.forcemerge(index=index_name, max_num_segments=1)
+        search_response = http_session.get(f'{es_url}/{index_name}/_search?size=0')
         if search_response.status_code == 200:
             total = search_response.json()['hits']['total']['value']
             print(f'Total documents in index: {total}')
-    else:
-        print('Error indexing data:', response.text)
-        
-except Exception as e:
-    print('Error:', e)
+            
+    except Exception as e:
+        print('Error:', e)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,147 @@
 import os
-import json
+import gzip
+import orjson
 import logging
-import requests
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-import random
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+import numpy as np
 from elasticsearch import Elasticsearch
+from elasticsearch.helpers import parallel_bulk
 import base64
+import binascii
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.conf import settings
+
+from services.http_client import http_session
 
 logger = logging.getLogger(__name__)
 
+# Elasticsearch's default index.max_result_window
+MAX_RESULT_WINDOW = 10000
+
+# Document fields the views read from search hits; everything else stays on the server
+SEARCH_SOURCE_FIELDS = [
+    '@timestamp', 'timestamp', 'application', 'cluster', 'bundle', 'pod',
+    'log_level', 'log_message', 'message', 'response_time', 'status_code', 'error_type'
+]
+
+# Stop counting matching docs past this; the total is then reported as a lower bound
+TRACK_TOTAL_HITS_LIMIT = 10000
+
+# Documents per _bulk request; small batches keep each request fast
+BULK_BATCH_SIZE = 100
+
+# gzip level for _bulk bodies; repetitive log NDJSON shrinks ~10x even at the fastest level
+BULK_GZIP_LEVEL = 1
+
+# _bulk requests in flight at once; stays well under the shared session's pool size
+BULK_MAX_WORKERS = 8
+
+# Per-item statuses of a successful bulk index action
+BULK_OK_STATUSES = frozenset((200, 201))
+
+# Seconds to wait for a TCP/TLS connect to ES; the read timeout is set per call
+ES_CONNECT_TIMEOUT = 5
+
+# Seconds a cluster health probe result is reused by is_available()
+AVAILABILITY_CACHE_TIMEOUT = 30
+
+# Response projections: only the parts of each payload the parsers below read
+SEARCH_FILTER_PATH = 'hits.total,hits.hits._id,hits.hits._source,hits.hits.sort'
+STATS_FILTER_PATH = 'hits.total.value,aggregations.*.buckets.key,aggregations.*.buckets.doc_count'
+HEALTH_FILTER_PATH = 'status,cluster_name,number_of_nodes'
+INDEX_STATS_FILTER_PATH = 'indices.*.total.docs.count,indices.*.total.store.size_in_bytes'
+
+# Index settings while seeding sample data: no periodic refreshes, no replica copies to write
+SEED_INDEX_SETTINGS = {'refresh_interval': '-1', 'number_of_replicas': 0}
+
+# Index the app writes logs to (the one created in cloud)
+LOG_INDEX_NAME = 'logops-logs'
+
+# Exact-match (doc-values) subfield for each filterable field, resolved once
+KEYWORD_FIELDS = {
+    field: f"{field}.keyword"
+    for field in ('application', 'cluster', 'bundle', 'pod', 'log_level', 'error_type')
+}
+
+# Terms aggregations available to get_log_statistics, by result key
+STATS_AGGREGATIONS = {
+    'log_levels': {"terms": {"field": KEYWORD_FIELDS['log_level'], "size": 10}},
+    'applications': {"terms": {"field": KEYWORD_FIELDS['application'], "size": 20}},
+    'clusters': {"terms": {"field": KEYWORD_FIELDS['cluster'], "size": 20}},
+    'pods': {"terms": {"field": KEYWORD_FIELDS['pod'], "size": 100}},
+    'bundles': {"terms": {"field": KEYWORD_FIELDS['bundle'], "size": 50}}
+}
+
+# source_file recorded on logs created by generate_sample_data
+SAMPLE_SOURCE_FILE = 'elasticsearch'
+
+# Message templates for generate_sample_data, by log level
+SAMPLE_LOG_MESSAGES = {
+    'INFO': [
+        'Service started successfully',
+        'Processing request completed',
+        'Health check passed',
+        'Database connection established',
+        'User authenticated successfully',
+        'Request processed in {}ms',
+        'Cache hit for key: user_{}',
+        'Background job completed',
+        'Configuration loaded successfully',
+        'Transaction completed successfully',
+        'Backup process initiated'
+    ],
+    'WARN': [
+        'High memory usage detected: {}%',
+        'Response time degradation: {}s',
+        'Queue backlog growing: {} pending items',
+        'Connection pool near capacity: {}%',
+        'Cache miss ratio high: {}%',
+        'Slow query detected: {}ms',
+        'Retry attempt {} for failed operation',
+        'Low disk space warning: {}% full'
+    ],
+    'ERROR': [
+        'Database connection timeout after {}s',
+        'Failed to process request: connection refused',
+        'Authentication failed: invalid credentials',
+        'OutOfMemoryError: Java heap space',
+        'Network timeout: connection reset by peer',
+        'Service temporarily unavailable',
+        'Invalid request format',
+        'Transaction rollback due to error',
+        'Critical service failure detected'
+    ]
+}
+
+
+def sample_value_range(template: str) -> Optional[Tuple[int, int]]:
+    """Inclusive range of the number filled into a sample message template; None if it takes none"""
+    if '{}' not in template:
+        return None
+    if 'ms' in template:
+        return (50, 2000)
+    if '%' in template:
+        return (70, 95)
+    if 's' in template and 'timeout' in template:
+        return (30, 120)
+    if 'pending' in template:
+        return (50, 500)
+    if 'attempt' in template:
+        return (1, 5)
+    return (100, 999)
+
+
+# Each template paired with its value range, classified once instead of per generated log
+SAMPLE_MESSAGE_TEMPLATES = {
+    level: [(template, sample_value_range(template)) for template in templates]
+    for level, templates in SAMPLE_LOG_MESSAGES.items()
+}
+
+
 class ElasticsearchService:
     """Enhanced Elasticsearch service that works with both local and cloud Elasticsearch"""
     
@@ -26,44 +158,40 @@ class ElasticsearchService:
             self.setup_local_connection()
         
         self.connection_retries = 0
+        # (monotonic time of the last health probe, its result)
+        self._available_state = (float('-inf'), False)
         self.max_retries = 3
-        self.setup_connection()
+        self._client = None
+        # Probing the cluster and seeding it with sample data is opt-in; by default the
+        # first real request is the first network call
+        if os.getenv('ES_SEED_SAMPLE') == '1':
+            self.setup_connection()
     
     def setup_cloud_connection(self):
-        """Setup connection for Elastic Cloud - FORCE FIX VERSION"""
-        
-        # FORCE the correct URL - bypasses all caching issues
-        correct_url = "https://ac3ac17baa504fe78bd6eef8734062c7.us-central1.gcp.cloud.es.io"
-        correct_api_key = "bnE2V3o1Y0JneUp0Tk9Zd0toVE46V3dGYWl5ZXUtenhXcWdDRWk1WjBPUQ=="
-        
-        print(f"🔧 FORCE FIX: Using URL: {correct_url}")
-        print(f"🔧 FORCE FIX: Using API Key: {correct_api_key[:20]}...")
-        
-        # Set the correct values directly
-        self.base_url = correct_url
-        self.auth_headers = {
-            'Authorization': f'ApiKey {correct_api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        # Test the connection immediately
+        """Setup connection for Elastic Cloud from ELASTICSEARCH_HOST (or the cloud id) and the API key"""
+        host = self.es_host or self.cloud_id_host(self.es_cloud_id)
+        if not host:
+            # An API key alone (or a malformed cloud id) doesn't say where the cluster is
+            logger.warning("⚠️ No Elastic Cloud host from ELASTICSEARCH_HOST or ELASTICSEARCH_CLOUD_ID; using local Elasticsearch")
+            self.setup_local_connection()
+            return
+        self.base_url = host if host.startswith(('http://', 'https://')) else f"https://{host}"
+        self.auth_headers = {'Content-Type': 'application/json'}
+        if self.es_api_key:
+            self.auth_headers['Authorization'] = f'ApiKey {self.es_api_key}'
+        logger.info(f"🌩️ Configured for Elastic Cloud: {self.base_url}")
+    
+    @staticmethod
+    def cloud_id_host(cloud_id: Optional[str]) -> str:
+        """ES host encoded in an Elastic Cloud id ('name:base64(domain$es_uuid$kibana_uuid)')"""
+        if not cloud_id or ':' not in cloud_id:
+            return ''
         try:
-            response = requests.get(f"{self.base_url}/_cluster/health", headers=self.auth_headers)
-            if response.status_code == 200:
-                print("✅ FORCE FIX: Connection successful!")
-                cluster_info = response.json()
-                print(f"✅ Cluster Status: {cluster_info.get('status', 'unknown')}")
-                print(f"✅ Nodes: {cluster_info.get('number_of_nodes', 0)}")
-                logger.info(f"🌩️ Configured for Elastic Cloud: {self.base_url}")
-                return True
-            else:
-                print(f"❌ FORCE FIX: Connection failed with status {response.status_code}")
-                logger.error(f"❌ Failed to connect to Elasticsearch: HTTP {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"❌ FORCE FIX: Connection error: {e}")
-            logger.error(f"❌ Error connecting to Elasticsearch: {str(e)}")
-            return False
+            domain, es_uuid = base64.b64decode(cloud_id.split(':', 1)[1]).decode('utf-8').split('$')[:2]
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            logger.warning("⚠️ ELASTICSEARCH_CLOUD_ID is malformed; ignoring it")
+            return ''
+        return f"{es_uuid}.{domain}"
 
     def setup_local_connection(self):
         """Setup connection for local Elasticsearch"""
@@ -75,49 +203,71 @@ class ElasticsearchService:
     def setup_connection(self):
         """Test connection and create sample data"""
         try:
-            response = requests.get(
+            response = http_session.get(
                 f"{self.base_url}/_cluster/health", 
                 headers=self.auth_headers,
-                timeout=10
+                timeout=(ES_CONNECT_TIMEOUT, 10)
             )
+            # Same probe is_available() makes; record it so the next availability check doesn't repeat it
+            self._available_state = (time.monotonic(), response.status_code == 200)
             if response.status_code == 200:
-                health_data = response.json()
+                health_data = orjson.loads(response.content)
                 logger.info(f"✅ Successfully connected to Elasticsearch: {health_data.get('cluster_name', 'Unknown')}")
                 self.create_sample_data()
             else:
                 logger.error(f"❌ Failed to connect to Elasticsearch: HTTP {response.status_code}")
                 logger.error(f"Response: {response.text}")
         except Exception as e:
+            self._available_state = (time.monotonic(), False)
             logger.error(f"❌ Error connecting to Elasticsearch: {str(e)}")
     
     def is_available(self) -> bool:
-        """Quick availability check"""
+        """Quick availability check, probed at most every AVAILABILITY_CACHE_TIMEOUT seconds"""
+        now = time.monotonic()
+        checked_at, available = self._available_state
+        if now - checked_at < AVAILABILITY_CACHE_TIMEOUT:
+            return available
         try:
-            response = requests.get(
+            response = http_session.get(
                 f"{self.base_url}/_cluster/health", 
                 headers=self.auth_headers,
-                timeout=5
+                timeout=(ES_CONNECT_TIMEOUT, 5)
             )
-            return response.status_code == 200
+            available = response.status_code == 200
         except:
-            return False
+            available = False
+        self._available_state = (now, available)
+        return available
     
-    @staticmethod   
+    @property
+    def client(self) -> Elasticsearch:
+        """elasticsearch-py client for the configured endpoint, built on first use"""
+        if self._client is None:
+            # The client sets its own Content-Type (NDJSON for bulk), so only pass auth
+            headers = {k: v for k, v in self.auth_headers.items() if k != 'Content-Type'}
+            # Bulk bodies are repetitive log JSON, so gzip them on the wire
+            self._client = Elasticsearch(self.base_url, headers=headers, request_timeout=60, http_compress=True)
+        return self._client
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
     def get_elasticsearch_client():
-       username = os.getenv("ELASTICSEARCH_USERNAME")
-       password = os.getenv("ELASTICSEARCH_PASSWORD")
+       """Basic-auth client built once per process, so its connection pool is reused across requests"""
+       username = settings.ELASTICSEARCH_USERNAME
+       password = settings.ELASTICSEARCH_PASSWORD
 
        if not username or not password:
         raise ValueError("Elasticsearch username or password is not set.")
 
        return Elasticsearch(
         hosts=[{
-            "host": os.getenv("ELASTICSEARCH_HOST", "3361399602e4406eb9fc6c6308f32ac8.us-central1.gcp.cloud.es.io"),
-            "port": 443,
-            "scheme": "https"
+            "host": settings.ELASTICSEARCH_HOST,
+            "port": settings.ELASTICSEARCH_PORT,
+            "scheme": settings.ELASTICSEARCH_SCHEME
         }],
         basic_auth=(username, password),
         verify_certs=True,
+        http_compress=True,
         request_timeout=30,
         max_retries=10,
         retry_on_timeout=True
@@ -127,13 +277,13 @@ class ElasticsearchService:
         """Create sample data if none exists"""
         try:
             # Check if we have data - FIXED: Remove -*
-            response = requests.get(
+            response = http_session.get(
                 f"{self.base_url}/logops-logs/_count", 
                 headers=self.auth_headers,
-                timeout=10
+                timeout=(ES_CONNECT_TIMEOUT, 10)
             )
             if response.status_code == 200:
-                count = response.json().get('count', 0)
+                count = orjson.loads(response.content).get('count', 0)
                 if count > 100:  # Reduced threshold to allow regeneration for testing
                     logger.info(f"✅ Found {count} existing logs in Elasticsearch")
                     return
@@ -141,12 +291,57 @@ class ElasticsearchService:
             # Create sample data
             logger.info("📊 Creating sample data for ALL 4 clusters in Elasticsearch...")
             sample_logs = self.generate_sample_data()
-            result = self.bulk_index_logs(sample_logs)
+            replicas = self.apply_seed_settings()
+            try:
+                result = self.bulk_index_logs(sample_logs)
+            finally:
+                if replicas is not None:
+                    self.restore_seed_settings(replicas)
             logger.info(f"✅ Created {result['indexed']} sample log entries covering all clusters")
                 
         except Exception as e:
             logger.error(f"❌ Error creating sample data: {str(e)}")
     
+    def put_index_settings(self, settings: Dict[str, Any]) -> bool:
+        """Update dynamic settings of the log index; False if it doesn't exist yet or the call fails"""
+        response = http_session.put(
+            f"{self.base_url}/{LOG_INDEX_NAME}/_settings",
+            data=orjson.dumps({'index': settings}),
+            headers=self.auth_headers,
+            timeout=(ES_CONNECT_TIMEOUT, 10)
+        )
+        return response.status_code == 200
+    
+    def apply_seed_settings(self) -> Optional[str]:
+        """Switch the log index to SEED_INDEX_SETTINGS; returns the replica count to restore, or None"""
+        try:
+            response = http_session.get(
+                f"{self.base_url}/{LOG_INDEX_NAME}/_settings/index.number_of_replicas",
+                params={'flat_settings': 'true'},
+                headers=self.auth_headers,
+                timeout=(ES_CONNECT_TIMEOUT, 10)
+            )
+            if response.status_code != 200:
+                return None  # No index yet; the first bulk request creates it
+            settings = orjson.loads(response.content)[LOG_INDEX_NAME]['settings']
+            replicas = settings.get('index.number_of_replicas', '1')
+            return replicas if self.put_index_settings(SEED_INDEX_SETTINGS) else None
+        except Exception as e:
+            logger.warning(f"⚠️ Could not apply bulk seed settings: {str(e)}")
+            return None
+    
+    def restore_seed_settings(self, replicas: str):
+        """Default refresh interval and the original replicas again, then make the seeded logs searchable"""
+        try:
+            self.put_index_settings({'refresh_interval': None, 'number_of_replicas': replicas})
+            http_session.post(
+                f"{self.base_url}/{LOG_INDEX_NAME}/_refresh",
+                headers=self.auth_headers,
+                timeout=(ES_CONNECT_TIMEOUT, 30)
+            )
+        except Exception as e:
+            logger.error(f"❌ Could not restore index settings after seeding: {str(e)}")
+    
     def generate_sample_data(self) -> List[Dict[str, Any]]:
         """Generate comprehensive sample data for ALL apps and ALL clusters"""
         applications = {
@@ -158,111 +353,74 @@ class ElasticsearchService:
         # ALL 4 clusters
         clusters = ['Cluster Prod AKS 1', 'Cluster Prod AKS 2', 'Cluster Prod AKS 3', 'Cluster Prod AKS 4']
         
-        log_messages = {
-            'INFO': [
-                'Service started successfully',
-                'Processing request completed',
-                'Health check passed',
-                'Database connection established',
-                'User authenticated successfully',
-                'Request processed in {}ms',
-                'Cache hit for key: user_{}',
-                'Background job completed',
-                'Configuration loaded successfully',
-                'Transaction completed successfully',
-                'Backup process initiated'
-            ],
-            'WARN': [
-                'High memory usage detected: {}%',
-                'Response time degradation: {}s',
-                'Queue backlog growing: {} pending items',
-                'Connection pool near capacity: {}%',
-                'Cache miss ratio high: {}%',
-                'Slow query detected: {}ms',
-                'Retry attempt {} for failed operation',
-                'Low disk space warning: {}% full'
-            ],
-            'ERROR': [
-                'Database connection timeout after {}s',
-                'Failed to process request: connection refused',
-                'Authentication failed: invalid credentials',
-                'OutOfMemoryError: Java heap space',
-                'Network timeout: connection reset by peer',
-                'Service temporarily unavailable',
-                'Invalid request format',
-                'Transaction rollback due to error',
-                'Critical service failure detected'
-            ]
-        }
-        
-        sample_logs = []
         base_time = datetime.now() - timedelta(days=1)
+        levels = ['INFO', 'WARN', 'ERROR']
         
-        # FIXED: Generate data for ALL clusters (removed slice)
-        for app_name, bundles in applications.items():
-            for cluster in clusters:  # ✅ NOW INCLUDES ALL 4 CLUSTERS
-                for bundle in bundles:
-                    for service_num in range(1, 6):  # 5 pods per bundle
-                        pod_name = f"{app_name.lower()}-{bundle.lower()}-web-{service_num:03d}"
-                        
-                        # Generate more logs per pod for better demo
-                        log_count = random.randint(60, 80)  # More logs per pod
-                        
-                        for _ in range(log_count):
-                            # Random time within the last 24 hours
-                            log_time = base_time + timedelta(
-                                hours=random.randint(0, 23),
-                                minutes=random.randint(0, 59),
-                                seconds=random.randint(0, 59)
-                            )
-                            
-                            # Weight log levels: 70% INFO, 20% WARN, 10% ERROR
-                            level = random.choices(
-                                ['INFO', 'WARN', 'ERROR'],
-                                weights=[70, 20, 10]
-                            )[0]
-                            
-                            # Select and format message
-                            message_template = random.choice(log_messages[level])
-                            
-                            if '{}' in message_template:
-                                if 'ms' in message_template:
-                                    message = message_template.format(random.randint(50, 2000))
-                                elif '%' in message_template:
-                                    message = message_template.format(random.randint(70, 95))
-                                elif 's' in message_template and 'timeout' in message_template:
-                                    message = message_template.format(random.randint(30, 120))
-                                elif 'pending' in message_template:
-                                    message = message_template.format(random.randint(50, 500))
-                                elif 'attempt' in message_template:
-                                    message = message_template.format(random.randint(1, 5))
-                                else:
-                                    message = message_template.format(random.randint(100, 999))
-                            else:
-                                message = message_template
-                            
-                            # Create log entry compatible with views.py expectations
-                            log_entry = {
-                                '@timestamp': log_time.isoformat(),
-                                'timestamp': log_time.isoformat(),
-                                'application': app_name,
-                                'cluster': cluster,
-                                'bundle': bundle,
-                                'pod': pod_name,
-                                'log_level': level,
-                                'log_message': message,
-                                'message': message,
-                                'source_file': 'elasticsearch'
-                            }
-                            
-                            # Add performance metrics occasionally
-                            if random.random() < 0.3:
-                                log_entry['response_time'] = round(random.uniform(0.1, 5.0), 3)
-                            
-                            if random.random() < 0.2:
-                                log_entry['status_code'] = random.choice([200, 201, 400, 401, 404, 500])
-                            
-                            sample_logs.append(log_entry)
+        # FIXED: Generate data for ALL clusters (removed slice); 5 pods per bundle
+        # The fields every log of a pod shares, built once per pod and copied into each entry
+        pod_bases = [
+            {
+                'application': app_name,
+                'cluster': cluster,
+                'bundle': bundle,
+                'pod': f"{app_name.lower()}-{bundle.lower()}-web-{service_num:03d}",
+                'source_file': SAMPLE_SOURCE_FILE
+            }
+            for app_name, bundles in applications.items()
+            for cluster in clusters  # ✅ NOW INCLUDES ALL 4 CLUSTERS
+            for bundle in bundles
+            for service_num in range(1, 6)
+        ]
+        
+        # Draw every random column as one numpy array; the loop below only assembles records
+        rng = np.random.default_rng()
+        logs_per_pod = rng.integers(60, 81, len(pod_bases))  # More logs per pod for better demo
+        total = int(logs_per_pod.sum())
+        pod_idx = np.repeat(np.arange(len(pod_bases)), logs_per_pod).tolist()
+        # Weight log levels: 70% INFO, 20% WARN, 10% ERROR
+        level_idx = rng.choice(len(levels), total, p=[0.7, 0.2, 0.1])
+        template_counts = np.array([len(SAMPLE_MESSAGE_TEMPLATES[level]) for level in levels])
+        template_idx = (rng.random(total) * template_counts[level_idx]).astype(int).tolist()
+        value_picks = rng.random(total).tolist()  # Scaled into each template's value range below
+        has_response_time = (rng.random(total) < 0.3).tolist()
+        response_times = rng.uniform(0.1, 5.0, total).round(3).tolist()
+        has_status = (rng.random(total) < 0.2).tolist()
+        status_picks = rng.choice([200, 201, 400, 401, 404, 500], total).tolist()
+        # Random time within the last 24 hours, rendered to ISO strings in one pass
+        offsets = rng.integers(0, 24 * 3600, total).astype('timedelta64[s]')
+        timestamps = np.datetime_as_string(np.datetime64(base_time, 'us') + offsets, unit='us').tolist()
+        
+        sample_logs = []
+        for i, (p, lv, t) in enumerate(zip(pod_idx, level_idx.tolist(), template_idx)):
+            level = levels[lv]
+            
+            # Select and format message
+            message_template, value_range = SAMPLE_MESSAGE_TEMPLATES[level][t]
+            if value_range is None:
+                message = message_template
+            else:
+                low, high = value_range
+                message = message_template.format(low + int(value_picks[i] * (high - low + 1)))
+            
+            # Create log entry compatible with views.py expectations
+            timestamp = timestamps[i]
+            log_entry = {
+                **pod_bases[p],
+                '@timestamp': timestamp,
+                'timestamp': timestamp,
+                'log_level': level,
+                'log_message': message,
+                'message': message
+            }
+            
+            # Add performance metrics occasionally
+            if has_response_time[i]:
+                log_entry['response_time'] = response_times[i]
+            
+            if has_status[i]:
+                log_entry['status_code'] = status_picks[i]
+            
+            sample_logs.append(log_entry)
         
         # Add some logs specifically for Cluster 4 to ensure it has data
         logger.info(f"📊 Generated {len(sample_logs)} logs covering all {len(clusters)} clusters")
@@ -276,63 +434,124 @@ class ElasticsearchService:
         
         return sample_logs
     
+    @staticmethod
+    def keyword_clause(field: str, value: Any) -> Dict[str, Any]:
+        """Exact-match clause on field.keyword; several values become one terms query"""
+        keyword_field = KEYWORD_FIELDS.get(field) or f"{field}.keyword"
+        if isinstance(value, (list, tuple, set)):
+            return {"terms": {keyword_field: list(value)}}
+        return {"term": {keyword_field: value}}
+    
+    def build_search_query(self, query_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Search request body for query_params; shared by search_logs and dashboard_snapshot"""
+        # Build search query - pagination happens in Elasticsearch, never in Python
+        size = max(1, min(int(query_params.get('size', 100)), MAX_RESULT_WINDOW))
+        page = max(1, int(query_params.get('page', 1)))
+        query = {
+            "size": size,
+            "_source": query_params.get('source_fields') or SEARCH_SOURCE_FIELDS,
+            "sort": [{"@timestamp": {"order": "desc"}}, {"_doc": {"order": "asc"}}],
+            "track_total_hits": TRACK_TOTAL_HITS_LIMIT
+        }
+        
+        if query_params.get('search_after'):
+            # Cursor paging reads only `size` docs per shard, at any depth; the
+            # caller already has the total from the first page, so don't recount
+            query["search_after"] = query_params['search_after']
+            query["track_total_hits"] = False
+        elif page > 1:
+            # Offset paging is bounded by index.max_result_window; deeper pages need the cursor
+            if page * size > MAX_RESULT_WINDOW:
+                raise ValueError(
+                    f"Page {page} of size {size} is past the first {MAX_RESULT_WINDOW} results; "
+                    f"page with search_after instead"
+                )
+            query["from"] = (page - 1) * size
+        
+        # Add filters - exactly what views.py expects
+        term_filters = [
+            self.keyword_clause(field, query_params[field])
+            for field in ['application', 'cluster', 'bundle', 'pod', 'log_level']
+            if query_params.get(field)
+        ]
+        
+        # Time bounds let ES skip whole segments by their @timestamp min/max
+        time_range = {}
+        if query_params.get('hours'):
+            time_range['gte'] = f"now-{int(query_params['hours'])}h"
+        if query_params.get('start_time'):
+            time_range['gte'] = query_params['start_time']
+        if query_params.get('end_time'):
+            time_range['lte'] = query_params['end_time']
+        if time_range:
+            term_filters.append({"range": {"@timestamp": time_range}})
+        
+        if query_params.get('search_text'):
+            # Text search is the only scored part; exact terms stay in filter context.
+            # Rank by relevance rather than time; _doc keeps search_after cursors unique
+            query["sort"] = ["_score", {"_doc": {"order": "asc"}}]
+            query["query"] = {
+                "bool": {
+                    "must": [{
+                        "multi_match": {
+                            "query": query_params['search_text'],
+                            "fields": ["log_message", "message"]
+                        }
+                    }],
+                    "filter": term_filters
+                }
+            }
+        elif term_filters:
+            # Filter-only searches are sorted by time, so skip scoring entirely
+            query["query"] = {"constant_score": {"filter": {"bool": {"filter": term_filters}}}}
+        else:
+            # If no filters, match all
+            query["query"] = {"match_all": {}}
+        return query
+    
+    @staticmethod
+    def parse_search_response(data: Dict[str, Any], query: Dict[str, Any], page: int) -> Dict[str, Any]:
+        """Result dict views.py expects, from one _search (or _msearch item) response"""
+        size = query["size"]
+        # filter_path omits empty sections, so no matches can mean no 'hits' key at all
+        hits_section = data.get('hits', {})
+        hits = hits_section.get('hits', [])
+        logs = [{**hit['_source'], '_id': hit['_id']} for hit in hits]
+        
+        # 'gte' means the count stopped at TRACK_TOTAL_HITS_LIMIT; no total when not tracked
+        total_hits = hits_section.get('total')
+        total = total_hits['value'] if total_hits else None
+        return {
+            'logs': logs,
+            'total': total,
+            'total_relation': total_hits['relation'] if total_hits else None,
+            'page': page,
+            'pages': max(1, -(-total // size)) if total is not None else None,
+            'size': len(logs),
+            # Cursor for the next page; pass back as query_params['search_after']
+            'search_after': hits[-1]['sort'] if hits else None
+        }
+    
     def search_logs(self, query_params: Dict[str, Any]) -> Dict[str, Any]:
         """Search logs using direct HTTP requests - Compatible with views.py"""
         try:
-            if not self.is_available():
-                logger.error("❌ Elasticsearch not available for search")
-                return {'logs': [], 'total': 0, 'error': 'Elasticsearch not available'}
-            
-            # Build search query
-            query = {
-                "query": {"bool": {"must": []}},
-                "size": query_params.get('size', 100),
-                "sort": [{"@timestamp": {"order": "desc"}}]
-            }
-            
-            # Add filters - exactly what views.py expects
-            for field in ['application', 'cluster', 'bundle', 'pod', 'log_level']:
-                if query_params.get(field):
-                    query["query"]["bool"]["must"].append({
-                        "term": {f"{field}.keyword": query_params[field]}
-                    })
-            
-            # Text search
-            if query_params.get('search_text'):
-                query["query"]["bool"]["must"].append({
-                    "multi_match": {
-                        "query": query_params['search_text'],
-                        "fields": ["log_message", "message"]
-                    }
-                })
-            
-            # If no filters, match all
-            if not query["query"]["bool"]["must"]:
-                query["query"] = {"match_all": {}}
+            # No availability precheck: a down cluster fails the search itself and lands in the except below
+            query = self.build_search_query(query_params)
             
             # Execute search - FIXED: Remove the -* pattern
-            response = requests.post(
+            response = http_session.post(
                 f"{self.base_url}/logops-logs/_search",  # CHANGED: removed -* 
-                json=query,
+                params={'filter_path': SEARCH_FILTER_PATH},
+                data=orjson.dumps(query),
                 headers=self.auth_headers,
-                timeout=15
+                timeout=(ES_CONNECT_TIMEOUT, 15)
             )
             
             if response.status_code == 200:
-                data = response.json()
-                logs = []
-                for hit in data['hits']['hits']:
-                    log_entry = hit['_source']
-                    log_entry['_id'] = hit['_id']
-                    logs.append(log_entry)
-                
-                logger.info(f"✅ Found {len(logs)} logs for query: {query_params}")
-                return {
-                    'logs': logs,
-                    'total': data['hits']['total']['value'],
-                    'page': query_params.get('page', 1),
-                    'size': len(logs)
-                }
+                data = orjson.loads(response.content)
+                result = self.parse_search_response(data, query, max(1, int(query_params.get('page', 1))))
+                logger.info(f"✅ Found {len(result['logs'])} logs for query: {query_params}")
+                return result
             else:
                 logger.error(f"❌ Search failed with HTTP {response.status_code}")
                 logger.error(f"Response: {response.text}")
@@ -342,94 +561,212 @@ class ElasticsearchService:
             logger.error(f"❌ Error searching logs: {str(e)}")
             return {'logs': [], 'total': 0, 'error': str(e)}
     
-    def bulk_index_logs(self, logs: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Bulk index logs using HTTP requests"""
+    def msearch_pods(self, application: str, cluster: str, bundle: str, pods: List[str],
+                     size: int = 1000, source_fields: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch logs for several pods in one _msearch round trip, keyed by pod"""
+        try:
+            if not pods:
+                return {}
+
+            header_line = orjson.dumps({'index': LOG_INDEX_NAME})
+            shared_filters = [
+                self.keyword_clause(field, value)
+                for field, value in (('application', application), ('cluster', cluster), ('bundle', bundle))
+                if value
+            ]
+            lines = []
+            for pod in pods:
+                lines.append(header_line)
+                lines.append(orjson.dumps({
+                    "size": max(1, min(int(size), MAX_RESULT_WINDOW)),
+                    "_source": source_fields or SEARCH_SOURCE_FIELDS,
+                    "sort": [{"@timestamp": {"order": "desc"}}, {"_doc": {"order": "asc"}}],
+                    "track_total_hits": False,
+                    "query": {"constant_score": {"filter": {"bool": {
+                        "filter": shared_filters + [self.keyword_clause('pod', pod)]
+                    }}}}
+                }))
+
+            msearch_headers = self.auth_headers.copy()
+            msearch_headers['Content-Type'] = 'application/x-ndjson'
+
+            response = http_session.post(
+                f"{self.base_url}/{LOG_INDEX_NAME}/_msearch",
+                data=b'\n'.join(lines) + b'\n',
+                headers=msearch_headers,
+                timeout=(ES_CONNECT_TIMEOUT, 30)
+            )
+
+            if response.status_code != 200:
+                logger.error(f"❌ Multi-search failed with HTTP {response.status_code}")
+                return {}
+
+            # Responses come back in request order; a failed sub-search has no 'hits'
+            logs_by_pod = {}
+            for pod, result in zip(pods, orjson.loads(response.content).get('responses', [])):
+                hits = result.get('hits', {}).get('hits', [])
+                logs_by_pod[pod] = [{**hit['_source'], '_id': hit['_id']} for hit in hits]
+
+            logger.info(f"✅ Multi-search fetched logs for {len(logs_by_pod)} pods")
+            return logs_by_pod
+
+        except Exception as e:
+            logger.error(f"❌ Multi-search error: {str(e)}")
+            return {}
+
+    @staticmethod
+    def to_document(log_entry: Any) -> Dict[str, Any]:
+        """Plain dict for a log entry; record objects expand themselves via to_document()"""
+        to_document = getattr(log_entry, 'to_document', None)
+        return to_document() if to_document is not None else log_entry
+    
+    @classmethod
+    def iter_bulk_lines(cls, action_line: bytes, batch: List[Any]) -> Iterable[bytes]:
+        """NDJSON pieces of one _bulk body: the action line, then the document, per entry"""
+        for log_entry in batch:
+            yield action_line
+            yield orjson.dumps(cls.to_document(log_entry))
+            yield b'\n'
+    
+    def post_bulk_batch(self, batch: List[Any], action_line: bytes, bulk_headers: Dict[str, str]) -> Tuple[int, int]:
+        """Send one _bulk request; returns (indexed, errors) for the batch"""
+        response = http_session.post(
+            f"{self.base_url}/_bulk",
+            data=gzip.compress(b''.join(self.iter_bulk_lines(action_line, batch)), compresslevel=BULK_GZIP_LEVEL),
+            headers=bulk_headers,
+            timeout=(ES_CONNECT_TIMEOUT, 60)
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"❌ Bulk index failed with HTTP {response.status_code}")
+            logger.error(f"Response: {response.text}")
+            return 0, len(batch)
+        
+        result = orjson.loads(response.content)
+        items = result['items']
+        # Bulk reports errors=false when every item succeeded; only then skip the scan
+        failed = 0 if not result.get('errors') else sum(
+            1 for item in items if item.get('index', {}).get('status') not in BULK_OK_STATUSES
+        )
+        return len(items) - failed, failed
+    
+    def bulk_index_logs(self, logs: List[Any], batch_size: int = BULK_BATCH_SIZE,
+                        max_workers: int = BULK_MAX_WORKERS) -> Dict[str, int]:
+        """Bulk index logs using HTTP requests, batch_size documents per _bulk call, up to max_workers in flight"""
         try:
             if not logs:
                 return {'indexed': 0, 'errors': 0}
             
-            # Prepare bulk data - use the existing index name
-            bulk_data = []
-            index_name = 'logops-logs'  # Use the index we created in cloud
-            
-            for log_entry in logs:
-                bulk_data.append(json.dumps({'index': {'_index': index_name}}))
-                bulk_data.append(json.dumps(log_entry))
-            
-            bulk_body = '\n'.join(bulk_data) + '\n'
+            action_line = orjson.dumps({'index': {'_index': LOG_INDEX_NAME}}) + b'\n'
             
             # Create headers for bulk request
             bulk_headers = self.auth_headers.copy()
             bulk_headers['Content-Type'] = 'application/x-ndjson'
+            bulk_headers['Content-Encoding'] = 'gzip'
             
-            response = requests.post(
-                f"{self.base_url}/_bulk",
-                data=bulk_body,
-                headers=bulk_headers,
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                indexed = len([item for item in result['items'] 
-                             if 'index' in item and item['index']['status'] in [200, 201]])
-                errors = len(result['items']) - indexed
-                
-                logger.info(f"✅ Bulk indexed {indexed} logs with {errors} errors")
-                return {'indexed': indexed, 'errors': errors}
+            batches = [logs[start:start + batch_size] for start in range(0, len(logs), batch_size)]
+            if len(batches) == 1 or max_workers <= 1:
+                results = [self.post_bulk_batch(batch, action_line, bulk_headers) for batch in batches]
             else:
-                logger.error(f"❌ Bulk index failed with HTTP {response.status_code}")
-                logger.error(f"Response: {response.text}")
-                return {'indexed': 0, 'errors': len(logs)}
+                # Batches are independent and the calls are I/O bound, so overlap their round trips
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                    futures = [executor.submit(self.post_bulk_batch, batch, action_line, bulk_headers)
+                               for batch in batches]
+                    results = [future.result() for future in as_completed(futures)]
+            
+            indexed = sum(batch_indexed for batch_indexed, _ in results)
+            errors = sum(batch_errors for _, batch_errors in results)
+            
+            logger.info(f"✅ Bulk indexed {indexed} logs with {errors} errors")
+            return {'indexed': indexed, 'errors': errors}
             
         except Exception as e:
             logger.error(f"❌ Bulk index error: {str(e)}")
             return {'indexed': 0, 'errors': len(logs)}
     
-    def get_log_statistics(self, filters: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Get log statistics - Compatible with views.py"""
+    def parallel_bulk_index(self, documents: Iterable[Any], chunk_size: int = 500,
+                            thread_count: int = 4, max_chunk_bytes: int = 10 * 1024 * 1024) -> Dict[str, int]:
+        """Stream documents into the log index with helpers.parallel_bulk; bytes are sent as pre-encoded JSON"""
         try:
-            query = {
-                "query": {"match_all": {}},
-                "size": 0,
-                "aggs": {
-                    "log_levels": {"terms": {"field": "log_level.keyword", "size": 10}},
-                    "applications": {"terms": {"field": "application.keyword", "size": 20}},
-                    "clusters": {"terms": {"field": "cluster.keyword", "size": 20}},
-                    "pods": {"terms": {"field": "pod.keyword", "size": 100}},
-                    "bundles": {"terms": {"field": "bundle.keyword", "size": 50}}
-                }
-            }
+            # Pre-encoded documents go through the helper untouched, skipping per-doc serialisation
+            actions = (
+                doc if isinstance(doc, (bytes, str)) else {'_index': LOG_INDEX_NAME, '_source': self.to_document(doc)}
+                for doc in documents
+            )
+            indexed = 0
+            errors = 0
+            for ok, info in parallel_bulk(
+                self.client,
+                actions,
+                thread_count=thread_count,
+                chunk_size=chunk_size,
+                max_chunk_bytes=max_chunk_bytes,
+                queue_size=4,
+                raise_on_error=False,
+                raise_on_exception=False,
+                index=LOG_INDEX_NAME
+            ):
+                if ok:
+                    indexed += 1
+                else:
+                    errors += 1
+                    logger.debug(f"Bulk item failed: {info}")
             
-            if filters:
-                must_filters = []
-                for field in ['application', 'cluster', 'bundle']:
-                    if filters.get(field):
-                        must_filters.append({"term": {f"{field}.keyword": filters[field]}})
-                
-                if must_filters:
-                    query["query"] = {"bool": {"must": must_filters}}
+            logger.info(f"✅ Parallel bulk indexed {indexed} logs with {errors} errors")
+            return {'indexed': indexed, 'errors': errors}
+            
+        except Exception as e:
+            logger.error(f"❌ Parallel bulk index error: {str(e)}")
+            return {'indexed': 0, 'errors': 0, 'error': str(e)}
+    
+    def build_stats_query(self, filters: Optional[Dict[str, Any]], names: List[str]) -> Dict[str, Any]:
+        """Aggregation-only request body for get_log_statistics and dashboard_snapshot"""
+        # size 0: only the aggregation buckets are returned, no hits. The aggregations
+        # collect every matching doc anyway, so an exact total costs no extra scan
+        query = {
+            "query": {"match_all": {}},
+            "size": 0,
+            "track_total_hits": True,
+            "aggs": {name: STATS_AGGREGATIONS[name] for name in names}
+        }
+        
+        if filters:
+            term_filters = []
+            for field in ['application', 'cluster', 'bundle']:
+                if filters.get(field):
+                    term_filters.append(self.keyword_clause(field, filters[field]))
+            
+            # Filter context skips scoring and lets ES cache the term bitsets
+            if term_filters:
+                query["query"] = {"bool": {"filter": term_filters}}
+        return query
+    
+    @staticmethod
+    def parse_stats_response(data: Dict[str, Any], names: List[str]) -> Dict[str, Any]:
+        """Bucket counts by aggregation name, plus the total log count"""
+        aggs = data.get('aggregations', {})
+        stats = {'total_logs': data['hits']['total']['value']}
+        for name in names:
+            stats[name] = {b['key']: b['doc_count'] for b in aggs.get(name, {}).get('buckets', [])}
+        return stats
+    
+    def get_log_statistics(self, filters: Dict[str, Any] = None, aggregations: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Get log statistics - Compatible with views.py; aggregations limits which buckets are computed"""
+        try:
+            names = list(aggregations) if aggregations is not None else list(STATS_AGGREGATIONS)
+            query = self.build_stats_query(filters, names)
             
             # FIXED: Remove -* pattern
-            response = requests.post(
+            response = http_session.post(
                 f"{self.base_url}/logops-logs/_search",
-                json=query,
+                params={'filter_path': STATS_FILTER_PATH},
+                data=orjson.dumps(query),
                 headers=self.auth_headers,
-                timeout=15
+                timeout=(ES_CONNECT_TIMEOUT, 15)
             )
             
             if response.status_code == 200:
-                data = response.json()
-                aggs = data.get('aggregations', {})
-                
-                return {
-                    'total_logs': data['hits']['total']['value'],
-                    'log_levels': {b['key']: b['doc_count'] for b in aggs.get('log_levels', {}).get('buckets', [])},
-                    'applications': {b['key']: b['doc_count'] for b in aggs.get('applications', {}).get('buckets', [])},
-                    'clusters': {b['key']: b['doc_count'] for b in aggs.get('clusters', {}).get('buckets', [])},
-                    'pods': {b['key']: b['doc_count'] for b in aggs.get('pods', {}).get('buckets', [])},
-                    'bundles': {b['key']: b['doc_count'] for b in aggs.get('bundles', {}).get('buckets', [])}
-                }
+                return self.parse_stats_response(orjson.loads(response.content), names)
             else:
                 logger.error(f"❌ Statistics query failed with HTTP {response.status_code}")
                 return {'error': f'HTTP {response.status_code}'}
@@ -438,26 +775,82 @@ class ElasticsearchService:
             logger.error(f"❌ Statistics error: {str(e)}")
             return {'error': str(e)}
     
+    def dashboard_snapshot(self, filters: Optional[Dict[str, Any]] = None, recent_size: int = 100) -> Dict[str, Any]:
+        """Log statistics and the most recent logs in one _msearch round trip"""
+        try:
+            names = list(STATS_AGGREGATIONS)
+            search_params = dict(filters or {}, size=recent_size)
+            search_query = self.build_search_query(search_params)
+            header_line = orjson.dumps({'index': LOG_INDEX_NAME})
+            body = b'\n'.join((
+                header_line, orjson.dumps(self.build_stats_query(filters, names)),
+                header_line, orjson.dumps(search_query),
+            )) + b'\n'
+            
+            msearch_headers = self.auth_headers.copy()
+            msearch_headers['Content-Type'] = 'application/x-ndjson'
+            response = http_session.post(
+                f"{self.base_url}/{LOG_INDEX_NAME}/_msearch",
+                data=body,
+                headers=msearch_headers,
+                timeout=(ES_CONNECT_TIMEOUT, 15)
+            )
+            if response.status_code != 200:
+                logger.error(f"❌ Dashboard snapshot failed with HTTP {response.status_code}")
+                error = {'error': f'HTTP {response.status_code}'}
+                return {'log_stats': error, 'recent_logs': dict(error, logs=[], total=0)}
+            
+            # Responses come back in request order; a failed sub-search carries 'error' instead of 'hits'
+            stats_data, search_data = orjson.loads(response.content).get('responses', [{}, {}])
+            return {
+                'log_stats': (self.parse_stats_response(stats_data, names) if 'hits' in stats_data
+                              else {'error': str(stats_data.get('error', 'no response'))}),
+                'recent_logs': (self.parse_search_response(search_data, search_query, 1) if 'hits' in search_data
+                                else {'logs': [], 'total': 0, 'error': str(search_data.get('error', 'no response'))}),
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Dashboard snapshot error: {str(e)}")
+            return {'log_stats': {'error': str(e)}, 'recent_logs': {'logs': [], 'total': 0, 'error': str(e)}}
+    
     def get_health_status(self) -> Dict[str, Any]:
         """Get Elasticsearch health status"""
         try:
-            response = requests.get(
-                f"{self.base_url}/_cluster/health", 
-                headers=self.auth_headers,
-                timeout=10
-            )
-            if response.status_code == 200:
-                health = response.json()
-                
-                # Get index statistics - FIXED: Use correct pattern
-                stats_response = requests.get(
-                    f"{self.base_url}/logops-logs/_stats", 
+            # A recent failed probe means the cluster is down; don't wait on two more timeouts
+            checked_at, available = self._available_state
+            if not available and time.monotonic() - checked_at < AVAILABILITY_CACHE_TIMEOUT:
+                return {'status': 'error', 'available': False, 'error': 'Elasticsearch not available'}
+            
+            # Health and index stats are independent, so fetch both at once and only the fields used below
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                health_future = executor.submit(
+                    http_session.get,
+                    f"{self.base_url}/_cluster/health",
+                    params={'level': 'cluster', 'filter_path': HEALTH_FILTER_PATH},
                     headers=self.auth_headers,
-                    timeout=10
+                    timeout=(ES_CONNECT_TIMEOUT, 10)
                 )
+                stats_future = executor.submit(
+                    http_session.get,
+                    f"{self.base_url}/{LOG_INDEX_NAME}/_stats/docs,store",
+                    params={'filter_path': INDEX_STATS_FILTER_PATH},
+                    headers=self.auth_headers,
+                    timeout=(ES_CONNECT_TIMEOUT, 10)
+                )
+                response = health_future.result()
+                try:
+                    stats_response = stats_future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ Index stats unavailable: {str(e)}")
+                    stats_response = None
+            
+            self._available_state = (time.monotonic(), response.status_code == 200)
+            if response.status_code == 200:
+                health = orjson.loads(response.content)
+                
                 indices = {}
-                if stats_response.status_code == 200:
-                    stats_data = stats_response.json()
+                if stats_response is not None and stats_response.status_code == 200:
+                    stats_data = orjson.loads(stats_response.content)
                     for name, stats in stats_data.get('indices', {}).items():
                         indices[name] = {
                             'doc_count': stats['total']['docs']['count'],
@@ -479,5 +872,14 @@ class ElasticsearchService:
             return {'status': 'error', 'available': False, 'error': str(e)}
 
 
-# Global service instance
-elasticsearch_service = ElasticsearchService()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_elasticsearch_service() -> ElasticsearchService:
+    """The shared service instance, constructed on first use rather than at import"""
+    return ElasticsearchService()
+
+
+def __getattr__(name: str) -> Any:
+    """Keep `from services.elasticsearch_service import elasticsearch_service` working, lazily"""
+    if name == 'elasticsearch_service':
+        return get_elasticsearch_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,27 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool size per host; covers the worker threads hitting ES at once
+HTTP_POOL_SIZE = 32
+
+
+def build_http_session() -> requests.Session:
+    """Create a keep-alive session with a sized connection pool and retries on connection failures and gateway errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        # raise_on_status=False hands the last 5xx response back once retries run out,
+        # so callers see status_code as before instead of a RetryError
+        max_retries=Retry(total=2, read=False, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+                          raise_on_status=False),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by every outbound HTTP call (Elasticsearch and Together AI) so
+# connections and TLS sessions are reused instead of re-negotiated per call
+http_session = build_http_session()
@@ -0,0 +1,8 @@
+# Field mappings shared by the loader and the index template setup; kept free of
+# heavy imports so either script can use them without pulling in the other
+
+# Categorical fields are exact-match: no analyzed text. The parent keyword stays indexed
+# so term/match queries on `<field>` work; aggregations and sorting use `<field>.keyword`,
+# so only the subfield keeps doc values
+KEYWORD_ONLY = {'type': 'keyword', 'doc_values': False,
+                'fields': {'keyword': {'type': 'keyword'}}}
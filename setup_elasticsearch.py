@@ -2,14 +2,15 @@ import requests
 import json
 from datetime import datetime
 
+from services.log_mapping import KEYWORD_ONLY
+
 def setup_elasticsearch_mapping():
     """Setup proper Elasticsearch mapping for LogOps"""
     
     base_url = "http://localhost:9200"
     
-    # Create index template for logops-logs-*
-    template = {
-        "index_patterns": ["logops-logs-*"],
+    # Field mappings live in a component template so other index templates can reuse them
+    component_template = {
         "template": {
             "mappings": {
                 "properties": {
@@ -19,46 +20,12 @@ def setup_elasticsearch_mapping():
                     "timestamp": {
                         "type": "date"
                     },
-                    "application": {
-                        "type": "text",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword"
-                            }
-                        }
-                    },
-                    "cluster": {
-                        "type": "text",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword"
-                            }
-                        }
-                    },
-                    "bundle": {
-                        "type": "text",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword"
-                            }
-                        }
-                    },
-                    "pod": {
-                        "type": "text",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword"
-                            }
-                        }
-                    },
-                    "log_level": {
-                        "type": "text",
-                        "fields": {
-                            "keyword": {
-                                "type": "keyword"
-                            }
-                        }
-                    },
+                    # Exact-match only: aggregations and sorting use the .keyword subfield
+                    "application": KEYWORD_ONLY,
+                    "cluster": KEYWORD_ONLY,
+                    "bundle": KEYWORD_ONLY,
+                    "pod": KEYWORD_ONLY,
+                    "log_level": KEYWORD_ONLY,
                     "log_message": {
                         "type": "text"
                     },
@@ -79,10 +46,36 @@ def setup_elasticsearch_mapping():
         }
     }
     
+    # The app writes to the literal logops-logs index; the loader to dated logops-logs-* ones
+    template = {
+        "index_patterns": ["logops-logs", "logops-logs-*"],
+        "composed_of": ["logops-fields"],
+        "template": {
+            # Single-node development cluster: one shard, no replicas, relaxed refresh
+            "settings": {
+                "index": {
+                    "refresh_interval": "5s",
+                    "number_of_shards": 1,
+                    "number_of_replicas": 0
+                }
+            }
+        }
+    }
+    
     try:
         # Delete old template if exists
         requests.delete(f"{base_url}/_index_template/logops-template")
         
+        # Component template first; the index template refers to it by name
+        response = requests.put(
+            f"{base_url}/_component_template/logops-fields",
+            json=component_template,
+            headers={'Content-Type': 'application/json'}
+        )
+        if response.status_code not in [200, 201]:
+            print(f"❌ Failed to create component template: {response.status_code} - {response.text}")
+            return False
+        
         # Create new template
         response = requests.put(
             f"{base_url}/_index_template/logops-template",
@@ -1,43 +1,97 @@
 #!/usr/bin/env python
 """
 Simple test to check Django-Elasticsearch integration
-Run this: python simple_test.py
+Run this: python simple_test.py [--newest]
 """
 
-import requests
-import json
+import sys
 
-def test_direct_search():
+from elasticsearch import Elasticsearch
+
+# One pooled client for the script; it handles NDJSON encoding, keep-alive and gzip
+ES = Elasticsearch("http://localhost:9200", http_compress=True, request_timeout=10)
+
+# Search for FOBPM documents; exact terms in filter context, since scores are never used
+DIRECT_SEARCH_QUERY = {
+    "query": {
+        "bool": {
+            "filter": [
+                {"term": {"application.keyword": "FOBPM"}},
+                {"term": {"cluster.keyword": "Cluster Prod AKS 1"}},
+                {"term": {"bundle.keyword": "Bulkdeviceenrollment"}}
+            ]
+        }
+    },
+    "size": 5,
+    # Any five matches will do; index order skips the per-shard sort unless --newest asks for it
+    "sort": [{"@timestamp": {"order": "desc"}}] if '--newest' in sys.argv else ["_doc"],
+    # Only the fields the sample document printout uses
+    "_source": ["application", "cluster", "bundle", "pod", "log_message", "message"]
+}
+
+# Buckets only: no hits, no total count, and no query (match_all is the default)
+AGG_QUERY = {
+    "size": 0,
+    "track_total_hits": False,
+    "aggs": {
+        "applications": {"terms": {"field": "application.keyword", "size": 10}},
+        "clusters": {"terms": {"field": "cluster.keyword", "size": 10}},
+        "bundles": {"terms": {"field": "bundle.keyword", "size": 10}}
+    }
+}
+
+MATCH_SEARCH_QUERY = {
+    "query": {
+        "bool": {
+            "must": [
+                {"match": {"application": "FOBPM"}},
+                {"match": {"cluster": "Cluster Prod AKS 1"}},
+                {"match": {"bundle": "Bulkdeviceenrollment"}}
+            ]
+        }
+    },
+    # Only "any match?" matters here: no fetch phase, and shards stop counting at the first hit
+    "size": 0,
+    "track_total_hits": 1
+}
+
+# Fixed preference so repeated runs hit the same shard copies and their warm caches
+SEARCH_HEADER = {"preference": "test_simple"}
+# The bucket counts are only recomputed when the index changes
+AGG_SEARCH_HEADER = {**SEARCH_HEADER, "request_cache": True}
+
+# Only what the tests below read: hit totals and sources, bucket keys/counts, and errors.
+# Every item keeps its status, so none is filtered away and responses stay in query order
+MSEARCH_FILTER_PATH = ','.join((
+    'responses.status',
+    'responses.hits.total',
+    'responses.hits.hits._source',
+    'responses.aggregations.*.buckets.key',
+    'responses.aggregations.*.buckets.doc_count',
+    'responses.error',
+))
+
+def run_searches(searches):
+    """Run every (header, query) pair in one _msearch round trip; one response (or {'error': ...}) per query"""
+    try:
+        response = ES.msearch(
+            index="logops-logs-*",
+            searches=[line for header, query in searches for line in (header, query)],
+            filter_path=MSEARCH_FILTER_PATH,
+        )
+        return response['responses']
+    except Exception as e:
+        return [{'error': str(e)} for _ in searches]
+
+def test_direct_search(result):
     """Test direct Elasticsearch search for FOBPM data"""
     print("🔍 Testing Direct Elasticsearch Search...")
     
-    # Search for FOBPM documents
-    search_query = {
-        "query": {
-            "bool": {
-                "must": [
-                    {"term": {"application.keyword": "FOBPM"}},
-                    {"term": {"cluster.keyword": "Cluster Prod AKS 1"}},
-                    {"term": {"bundle.keyword": "Bulkdeviceenrollment"}}
-                ]
-            }
-        },
-        "size": 5,
-        "sort": [{"@timestamp": {"order": "desc"}}]
-    }
-    
     try:
-        response = requests.post(
-            "http://localhost:9200/logops-logs-*/_search",
-            json=search_query,
-            headers={'Content-Type': 'application/json'},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            hits = data['hits']['hits']
-            total = data['hits']['total']['value']
+        if 'error' not in result:
+            # filter_path drops empty sections, so no matches means no hits.hits key
+            hits = result['hits'].get('hits', [])
+            total = result['hits']['total']['value']
             
             print(f"✅ Found {total} total documents")
             print(f"📝 Retrieved {len(hits)} documents")
@@ -55,39 +109,20 @@ def test_direct_search():
             else:
                 print("❌ No documents found for FOBPM-Cluster Prod AKS 1-Bulkdeviceenrollment")
         else:
-            print(f"❌ Search failed: {response.status_code}")
-            print(f"Response: {response.text}")
+            print(f"❌ Search failed: {result['error']}")
             
     except Exception as e:
         print(f"❌ Error: {e}")
     
     return False
 
-def test_aggregations():
+def test_aggregations(result):
     """Test what applications/clusters/bundles exist"""
     print("\n🔍 Testing Available Data...")
     
-    agg_query = {
-        "query": {"match_all": {}},
-        "size": 0,
-        "aggs": {
-            "applications": {"terms": {"field": "application.keyword", "size": 10}},
-            "clusters": {"terms": {"field": "cluster.keyword", "size": 10}},
-            "bundles": {"terms": {"field": "bundle.keyword", "size": 10}}
-        }
-    }
-    
     try:
-        response = requests.post(
-            "http://localhost:9200/logops-logs-*/_search",
-            json=agg_query,
-            headers={'Content-Type': 'application/json'},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            aggs = data.get('aggregations', {})
+        if 'error' not in result:
+            aggs = result.get('aggregations', {})
             
             print("📊 Available Applications:")
             for bucket in aggs.get('applications', {}).get('buckets', []):
@@ -100,42 +135,24 @@ def test_aggregations():
             print("📊 Available Bundles:")
             for bucket in aggs.get('bundles', {}).get('buckets', []):
                 print(f"   - {bucket['key']} ({bucket['doc_count']} logs)")
+        else:
+            print(f"❌ Aggregation error: {result['error']}")
                 
     except Exception as e:
         print(f"❌ Aggregation error: {e}")
 
-def test_without_keyword():
+def test_without_keyword(result):
     """Test search without .keyword fields"""
     print("\n🔍 Testing Search Without Keyword Fields...")
     
-    search_query = {
-        "query": {
-            "bool": {
-                "must": [
-                    {"match": {"application": "FOBPM"}},
-                    {"match": {"cluster": "Cluster Prod AKS 1"}},
-                    {"match": {"bundle": "Bulkdeviceenrollment"}}
-                ]
-            }
-        },
-        "size": 5
-    }
-    
     try:
-        response = requests.post(
-            "http://localhost:9200/logops-logs-*/_search",
-            json=search_query,
-            headers={'Content-Type': 'application/json'},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            total = data['hits']['total']['value']
-            print(f"✅ Found {total} documents with match queries")
-            return total > 0
+        if 'error' not in result:
+            total = result['hits']['total']
+            at_least = "at least " if total['relation'] == 'gte' else ""
+            print(f"✅ Found {at_least}{total['value']} documents with match queries")
+            return total['value'] >= 1
         else:
-            print(f"❌ Match query failed: {response.status_code}")
+            print(f"❌ Match query failed: {result['error']}")
             
     except Exception as e:
         print(f"❌ Match query error: {e}")
@@ -146,13 +163,20 @@ if __name__ == "__main__":
     print("🚀 Testing Elasticsearch Data...")
     print("=" * 50)
     
+    # All three searches go out together; the tests below only report on their results
+    direct_result, agg_result, match_result = run_searches([
+        (SEARCH_HEADER, DIRECT_SEARCH_QUERY),
+        (AGG_SEARCH_HEADER, AGG_QUERY),
+        (SEARCH_HEADER, MATCH_SEARCH_QUERY),
+    ])
+    
     # Test 1: Check what data exists
-    test_aggregations()
+    test_aggregations(agg_result)
     
     # Test 2: Try exact search
-    if not test_direct_search():
+    if not test_direct_search(direct_result):
         # Test 3: Try without keyword fields
-        test_without_keyword()
+        test_without_keyword(match_result)
     
     print("\n" + "=" * 50)
-    print("🏁 Test complete!")
\ No newline at end of file
+    print("🏁 Test complete!")